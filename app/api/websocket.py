@@ -236,6 +236,19 @@ class NotificationService:
         )
         
         await self.manager.send_to_user(user_id, message.dict())
+    
+    async def notify_user_message(self, user_id: str, notification_type: str,
+                                  message: Optional[str], data: Dict[str, Any]):
+        """Notify user with a custom notification type and data."""
+        notification = NotificationMessage(
+            type=notification_type,
+            user_id=user_id,
+            timestamp=datetime.utcnow(),
+            data=data,
+            message=message
+        )
+        
+        await self.manager.send_to_user(user_id, notification.dict())
 
 
 # Global notification service instance
@@ -1,7 +1,7 @@
 """Configuration settings for the Job Application Automation Platform."""
 
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import Literal, Optional
 
 
 class Settings(BaseSettings):
@@ -17,6 +17,7 @@ class Settings(BaseSettings):
     
     # Redis settings
     redis_url: str = "redis://localhost:6379/0"
+    redis_ping_timeout: float = 2.0
     
     # Celery settings
     celery_broker_url: str = "redis://localhost:6379/0"
@@ -30,10 +31,20 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 # 1 day
     
+    # Maximum number of services started concurrently by the orchestrator
+    startup_parallelism: int = 4
+    
     # Data directories
     data_dir: str = "data"
     resume_storage_path: str = "data/resumes"
     
+    # PDF rendering worker processes (None uses the CPU count)
+    pdf_workers: Optional[int] = None
+    
+    # Application screenshots: every step, only the initial/submitted/error
+    # steps, or none at all
+    screenshot_policy: Literal["all", "errors_only", "none"] = "all"
+    
     # MongoDB settings
     mongodb_max_connections: int = 100
     mongodb_min_connections: int = 10
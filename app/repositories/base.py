@@ -98,6 +98,16 @@ class BaseRepository(Generic[T], ABC):
         
         return await query.to_list()
     
+    @handle_db_errors
+    async def find_projected(self,
+                             filter_dict: Dict[str, Any],
+                             fields: List[str]) -> List[Dict[str, Any]]:
+        """Find raw documents matching filter, returning only the given fields and _id."""
+        cursor = self.model_class.get_motor_collection().find(
+            filter_dict, {field: 1 for field in fields}
+        )
+        return await cursor.to_list(length=None)
+    
     @handle_db_errors
     async def find_one(self, filter_dict: Dict[str, Any]) -> Optional[T]:
         """Find single document matching filter."""
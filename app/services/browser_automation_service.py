@@ -1,8 +1,11 @@
 """Browser automation service using Playwright for job application submission."""
 
 import asyncio
+import functools
+import itertools
 import logging
-from typing import Dict, List, Optional, Any, Tuple
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional, Any, Tuple
 from datetime import datetime
 from pathlib import Path
 import json
@@ -26,6 +29,49 @@ from app.services.retry_service import (
 )
 
 
+# Shared by every screenshot writer
+SCREENSHOTS_DIR = Path("data/screenshots")
+
+
+@functools.lru_cache(maxsize=None)
+def get_screenshots_dir() -> Path:
+    """Return the screenshots directory, creating it on first use only."""
+    SCREENSHOTS_DIR.mkdir(parents=True, exist_ok=True)
+    return SCREENSHOTS_DIR
+
+# For each field type, take the first match of the first selector whose match
+# is visible, keeping FormFieldMapper.FIELD_SELECTORS priority order
+_DETECT_FIELDS_JS = """(fieldSelectors) => {
+    const detected = {};
+    for (const [fieldType, selectors] of Object.entries(fieldSelectors)) {
+        for (const selector of selectors) {
+            let element;
+            try {
+                element = document.querySelector(selector);
+            } catch (e) {
+                continue;
+            }
+            if (element && element.offsetParent !== null) {
+                detected[fieldType] = {
+                    selector,
+                    attributes: {
+                        tagName: element.tagName,
+                        type: element.type || '',
+                        name: element.name || '',
+                        id: element.id || '',
+                        placeholder: element.placeholder || '',
+                        required: element.required || false,
+                        visible: true
+                    }
+                };
+                break;
+            }
+        }
+    }
+    return detected;
+}"""
+
+
 class BrowserAutomationError(Exception):
     """Base exception for browser automation errors."""
     pass
@@ -148,39 +194,24 @@ class FormFieldMapper:
         Returns:
             Dictionary mapping field types to detected elements
         """
-        detected_fields = {}
+        # One round trip resolves every field type in the page
+        matches = await page.evaluate(_DETECT_FIELDS_JS, cls.FIELD_SELECTORS)
         
-        for field_type, selectors in cls.FIELD_SELECTORS.items():
-            for selector in selectors:
-                try:
-                    element = await page.query_selector(selector)
-                    if element:
-                        # Get element attributes
-                        attributes = await element.evaluate("""
-                            (element) => {
-                                return {
-                                    tagName: element.tagName,
-                                    type: element.type || '',
-                                    name: element.name || '',
-                                    id: element.id || '',
-                                    placeholder: element.placeholder || '',
-                                    required: element.required || false,
-                                    visible: element.offsetParent !== null
-                                };
-                            }
-                        """)
-                        
-                        if attributes['visible']:
-                            detected_fields[field_type] = {
-                                'selector': selector,
-                                'element': element,
-                                'attributes': attributes
-                            }
-                            break
-                            
-                except Exception as e:
-                    # Continue to next selector if this one fails
-                    continue
+        # Only matched fields need a handle; query_selector returns the same
+        # first match the page saw
+        elements = await asyncio.gather(
+            *(page.query_selector(match['selector']) for match in matches.values()),
+            return_exceptions=True
+        )
+        
+        detected_fields = {}
+        for (field_type, match), element in zip(matches.items(), elements):
+            if element and not isinstance(element, Exception):
+                detected_fields[field_type] = {
+                    'selector': match['selector'],
+                    'element': element,
+                    'attributes': match['attributes']
+                }
         
         return detected_fields
     
@@ -347,6 +378,91 @@ class BrowserManager:
             self.logger.error(f"Error during browser cleanup: {e}")
 
 
+class BrowserPool:
+    """Fixed-size pool of browsers that hands out isolated pages.
+    
+    Pages are spread round-robin across the browsers, and each browser hosts
+    at most ``max_tabs_per_browser`` pages at a time, so many applications can
+    run concurrently without one browser process per application.
+    """
+    
+    def __init__(self, num_browsers: int = 2, max_tabs_per_browser: int = 10):
+        """Initialize browser pool.
+        
+        Args:
+            num_browsers: Number of browser processes
+            max_tabs_per_browser: Maximum concurrent pages per browser
+        """
+        self.logger = logging.getLogger(__name__)
+        self.num_browsers = num_browsers
+        self.max_tabs_per_browser = max_tabs_per_browser
+        self._managers: List[BrowserManager] = []
+        self._tab_slots: List[asyncio.Semaphore] = []
+        self._tab_ids = itertools.count()
+    
+    async def start(self, headless: bool = True, browser_type: str = "chromium") -> None:
+        """Launch all browsers in the pool.
+        
+        Args:
+            headless: Whether to run browsers in headless mode
+            browser_type: Browser type (chromium, firefox, webkit)
+        """
+        if self._managers:
+            return
+        
+        managers = [BrowserManager() for _ in range(self.num_browsers)]
+        await asyncio.gather(*(manager.start(headless=headless, browser_type=browser_type) for manager in managers))
+        
+        self._managers = managers
+        self._tab_slots = [asyncio.Semaphore(self.max_tabs_per_browser) for _ in managers]
+        self.logger.info(
+            f"Browser pool started: {self.num_browsers} x {self.max_tabs_per_browser} tabs"
+        )
+    
+    @asynccontextmanager
+    async def page(
+        self,
+        user_agent: Optional[str] = None,
+        viewport: Optional[Dict[str, int]] = None
+    ) -> AsyncIterator[Page]:
+        """Borrow a page in its own browser context.
+        
+        Waits while the chosen browser already hosts its maximum number of
+        pages. The context is closed when the block exits.
+        
+        Args:
+            user_agent: Custom user agent string
+            viewport: Viewport size dictionary
+            
+        Yields:
+            Playwright page object
+        """
+        if not self._managers:
+            raise BrowserAutomationError("Browser pool not started")
+        
+        index = next(self._tab_ids) % len(self._managers)
+        manager = self._managers[index]
+        
+        async with self._tab_slots[index]:
+            context = await manager.create_context(user_agent=user_agent, viewport=viewport)
+            try:
+                page = await context.new_page()
+                
+                # Set default timeouts
+                page.set_default_timeout(30000)  # 30 seconds
+                page.set_default_navigation_timeout(60000)  # 60 seconds
+                
+                yield page
+            finally:
+                await manager.close_context(context)
+    
+    async def stop(self) -> None:
+        """Stop all browsers in the pool."""
+        managers, self._managers, self._tab_slots = self._managers, [], []
+        await asyncio.gather(*(manager.stop() for manager in managers))
+        self.logger.info("Browser pool stopped")
+
+
 class FileUploadHandler:
     """Handles file uploads with error handling and validation."""
     
@@ -762,11 +878,7 @@ class BrowserAutomationService:
                 timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
                 filename = f"screenshot_{timestamp}.png"
             
-            # Ensure screenshots directory exists
-            screenshots_dir = Path("data/screenshots")
-            screenshots_dir.mkdir(parents=True, exist_ok=True)
-            
-            screenshot_path = screenshots_dir / filename
+            screenshot_path = get_screenshots_dir() / filename
             
             await page.screenshot(
                 path=str(screenshot_path),
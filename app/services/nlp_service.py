@@ -785,9 +785,9 @@ class NLPService:
         if "skills" in optimized:
             current_skills = set()
             if isinstance(optimized["skills"], list):
-                current_skills = set([skill.lower() for skill in optimized["skills"]])
+                current_skills = {skill.lower() for skill in optimized["skills"]}
             elif isinstance(optimized["skills"], str):
-                current_skills = set([skill.strip().lower() for skill in optimized["skills"].split(",")])
+                current_skills = {skill.strip() for skill in optimized["skills"].lower().split(",")}
             
             # Add missing technical skills that the user likely has
             resume_text = self._resume_dict_to_text(resume_content).lower()
@@ -810,10 +810,10 @@ class NLPService:
             summary_lower = summary.lower()
             
             # Add important keywords to summary if not present
-            keywords_to_add = []
-            for keyword in list(job_keywords)[:5]:  # Top 5 keywords
-                if keyword not in summary_lower and len(keyword) > 3:
-                    keywords_to_add.append(keyword)
+            keywords_to_add = [
+                keyword for keyword in list(job_keywords)[:5]  # Top 5 keywords
+                if len(keyword) > 3 and keyword not in summary_lower
+            ]
             
             if keywords_to_add:
                 # Add keywords naturally to the summary
@@ -11,6 +11,23 @@ from app.models.user import User
 
 logger = logging.getLogger(__name__)
 
+# Maps agent status to (notification type, progress); unknown statuses fall back
+# to a zero-progress update.
+_AGENT_STATUS_MAP = {
+    "error": ("system_error", 0.0),
+    "active": ("progress_update", 1.0),
+    "inactive": ("progress_update", 0.0),
+}
+_AGENT_STATUS_DEFAULT = ("progress_update", 0.0)
+
+# Message templates for structured user notifications, rendered from "data" only
+# when the notification is actually delivered.
+_USER_MESSAGE_TEMPLATES = {
+    "application_queued": "Application queued for {job_title} at {company}",
+    "application_progress": "Application progress: {step}",
+    "application_outcome_updated": "Application outcome updated: {outcome}",
+}
+
 
 class NotificationService:
     """Service for managing notifications across the application."""
@@ -55,9 +72,6 @@ class NotificationService:
                     except Exception as e:
                         logger.error(f"Failed to send WebSocket notification: {e}")
                 
-                # Mark task as done
-                self._notification_queue.task_done()
-                
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -104,6 +118,24 @@ class NotificationService:
                 enabled=notification["enabled"],
                 reason=notification.get("reason")
             )
+        elif notification_type in _USER_MESSAGE_TEMPLATES:
+            message = notification.get("message")
+            if message is None:
+                message = self._render_user_message(notification_type, notification["data"])
+            await self._websocket_service.notify_user_message(
+                user_id=user_id,
+                notification_type=notification_type,
+                message=message,
+                data=notification["data"]
+            )
+    
+    def _render_user_message(self, notification_type: str, data: Dict[str, Any]) -> Optional[str]:
+        """Render a structured notification's message, or None if data lacks a field."""
+        try:
+            return _USER_MESSAGE_TEMPLATES[notification_type].format_map(data)
+        except KeyError as e:
+            logger.warning(f"Cannot render {notification_type} message, missing {e}")
+            return None
     
     async def queue_notification(self, notification: Dict[str, Any]):
         """Queue a notification for processing."""
@@ -213,8 +245,12 @@ class NotificationService:
     # Auto-Applier specific notification methods
     
     async def send_user_notification(self, user_id: str, notification_type: str, 
-                                   message: str, data: Optional[Dict[str, Any]] = None):
-        """Send a user notification with custom type and data."""
+                                   message: Optional[str] = None,
+                                   data: Optional[Dict[str, Any]] = None):
+        """Send a user notification with custom type and data.
+        
+        When ``message`` is omitted it is rendered from ``data`` at delivery time.
+        """
         await self.queue_notification({
             "type": notification_type,
             "user_id": user_id,
@@ -229,7 +265,6 @@ class NotificationService:
         await self.send_user_notification(
             user_id=user_id,
             notification_type="application_queued",
-            message=f"Application queued for {job_title} at {company}",
             data={
                 "application_id": application_id,
                 "job_title": job_title,
@@ -244,7 +279,6 @@ class NotificationService:
         await self.send_user_notification(
             user_id=user_id,
             notification_type="application_progress",
-            message=f"Application progress: {step}",
             data={
                 "application_id": application_id,
                 "job_title": job_title,
@@ -260,7 +294,6 @@ class NotificationService:
         await self.send_user_notification(
             user_id=user_id,
             notification_type="application_outcome_updated",
-            message=f"Application outcome updated: {outcome}",
             data={
                 "application_id": application_id,
                 "outcome": outcome
@@ -282,12 +315,17 @@ class NotificationService:
     async def notify_agent_status_change(self, user_id: str, agent_name: str, 
                                        status: str, details: Optional[str] = None):
         """Notify of agent status changes."""
+        notification_type, progress = _AGENT_STATUS_MAP.get(status, _AGENT_STATUS_DEFAULT)
+        if details:
+            details = f"Agent {agent_name} is {status}: {details}"
+        else:
+            details = f"Agent {agent_name} is {status}"
         await self.queue_notification({
-            "type": "system_error" if status == "error" else "progress_update",
+            "type": notification_type,
             "user_id": user_id,
             "operation": f"agent_{agent_name}",
-            "progress": 1.0 if status == "active" else 0.0,
-            "details": f"Agent {agent_name} is {status}" + (f": {details}" if details else ""),
+            "progress": progress,
+            "details": details,
             "timestamp": datetime.utcnow()
         })
     
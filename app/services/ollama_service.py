@@ -1,7 +1,9 @@
 """Ollama AI model service for resume optimization."""
 
 import asyncio
+import hashlib
 import logging
+import pickle
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
@@ -275,7 +277,9 @@ Please provide the extracted keywords in the following JSON format:
             result['optimization_metadata'] = {
                 'model_used': model or self.default_model,
                 'optimized_at': datetime.utcnow().isoformat(),
-                'original_content_hash': hash(str(resume_content))
+                'original_content_hash': hashlib.blake2b(
+                    pickle.dumps(resume_content, protocol=5), digest_size=8
+                ).hexdigest()
             }
             
             return result
@@ -1,20 +1,41 @@
 """System orchestrator service for managing application lifecycle."""
 
 import asyncio
+import contextlib
 import logging
+import time
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple, Callable
 from enum import Enum
 from dataclasses import dataclass
 import signal
 import sys
 
+from redis import asyncio as aioredis
+
 from app.config import settings
+from app.database import connect_to_mongo, close_mongo_connection
+from app.mcp.coordinator import coordinator
 from app.services.health_service import health_monitor, ServiceStatus
+from app.services.notification_service import (
+    initialize_notification_service,
+    shutdown_notification_service
+)
 
 
 logger = logging.getLogger(__name__)
 
+# How long a get_system_info payload may be served from cache (seconds)
+_SYSINFO_TTL = 1.0
+
+
+def _shutdown_signals() -> List[int]:
+    """Signals that should trigger a graceful shutdown on this platform."""
+    signals = [signal.SIGTERM, signal.SIGINT]
+    if hasattr(signal, 'SIGHUP'):
+        signals.append(signal.SIGHUP)
+    return signals
+
 
 class SystemState(str, Enum):
     """System state enumeration."""
@@ -26,38 +47,105 @@ class SystemState(str, Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class ServiceInfo:
     """Service information."""
     name: str
     status: str
     started_at: Optional[datetime] = None
     error: Optional[str] = None
+    started_at_iso: Optional[str] = None
+    
+    def __post_init__(self):
+        # started_at never changes, so format it once rather than per poll
+        if self.started_at is not None and self.started_at_iso is None:
+            self.started_at_iso = self.started_at.isoformat()
 
 
 class SystemOrchestrator:
     """Main system orchestrator for managing application lifecycle."""
     
     def __init__(self):
+        self._sysinfo_cache: Optional[Tuple[float, Dict[str, Any]]] = None
         self.state = SystemState.STOPPED
         self.services: Dict[str, ServiceInfo] = {}
+        # Serialized form of self.services, kept in step by _set_service
+        self._service_status_view: Dict[str, Dict[str, Any]] = {}
         self.startup_time: Optional[datetime] = None
-        self.shutdown_handlers: List[callable] = []
+        self._startup_time_iso: Optional[str] = None
+        self._startup_monotonic: Optional[float] = None
+        self._redis_client: Optional[aioredis.Redis] = None
+        # Caps concurrent connection attempts against shared infrastructure
+        self._startup_sem = asyncio.Semaphore(settings.startup_parallelism)
+        # (is_async, handler) pairs, classified once at registration
+        self.shutdown_handlers: List[Tuple[bool, Callable]] = []
+        # Ordered handlers unwind LIFO, with exceptions chained by the stack
+        self._ordered_shutdown_stack = contextlib.AsyncExitStack()
         self._shutdown_event = asyncio.Event()
+        # Static for the lifetime of the process
+        self._configuration = {
+            "debug": settings.debug,
+            "log_level": settings.log_level,
+            "environment": settings.environment,
+            "database": settings.database_name,
+            "mcp_agents_enabled": True,
+            "health_monitoring_enabled": True
+        }
+    
+    @property
+    def state(self) -> SystemState:
+        """Current system state."""
+        return self._state
+    
+    @state.setter
+    def state(self, value: SystemState):
+        self._state = value
+        self._sysinfo_cache = None
+    
+    def _set_service(self, info: ServiceInfo):
+        """Record service information and invalidate cached system info."""
+        self.services[info.name] = info
+        self._service_status_view[info.name] = {
+            "status": info.status,
+            "started_at": info.started_at_iso,
+            "error": info.error
+        }
+        self._sysinfo_cache = None
+    
+    def _mark_service_stopped(self, name: str):
+        """Mark a known service as stopped."""
+        if name in self.services:
+            self.services[name].status = "stopped"
+            self._service_status_view[name]["status"] = "stopped"
+            self._sysinfo_cache = None
     
     async def startup(self):
         """Execute system startup sequence."""
         logger.info("Starting system orchestrator...")
         self.state = SystemState.STARTING
-        self.startup_time = datetime.now()
+        self.startup_time = boot_time = datetime.now()
+        self._startup_time_iso = boot_time.isoformat()
+        self._startup_monotonic = time.monotonic()
         
         try:
-            # Initialize core services in order
-            await self._startup_database()
-            await self._startup_redis()
-            await self._startup_mcp_coordinator()
-            await self._startup_health_monitor()
-            await self._startup_notification_service()
+            # Independent infrastructure first; these only need the network
+            await asyncio.gather(
+                self._bounded_startup(self._startup_database(boot_time)),
+                self._bounded_startup(self._startup_redis(boot_time)),
+                self._bounded_startup(self._startup_health_monitor(boot_time)),
+            )
+            
+            # Services that depend on database/redis. Notification service
+            # failures are non-critical, so collect results instead of letting
+            # one failure cancel the other.
+            results = await asyncio.gather(
+                self._bounded_startup(self._startup_mcp_coordinator(boot_time)),
+                self._bounded_startup(self._startup_notification_service(boot_time)),
+                return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
             
             # Register shutdown handlers
             self._register_signal_handlers()
@@ -70,28 +158,30 @@ class SystemOrchestrator:
             self.state = SystemState.ERROR
             raise
     
+    async def _bounded_startup(self, coro):
+        """Await a startup step while holding the startup semaphore."""
+        async with self._startup_sem:
+            return await coro
+    
     async def shutdown(self):
         """Execute graceful system shutdown sequence."""
         logger.info("Starting system shutdown...")
         self.state = SystemState.STOPPING
         
         try:
-            # Execute shutdown handlers in reverse order
-            for handler in reversed(self.shutdown_handlers):
-                try:
-                    if asyncio.iscoroutinefunction(handler):
-                        await handler()
-                    else:
-                        handler()
-                except Exception as e:
-                    logger.error(f"Error in shutdown handler: {e}")
+            await self._run_shutdown_handlers()
             
-            # Shutdown services in reverse order
-            await self._shutdown_notification_service()
+            # Shutdown services in reverse dependency order
+            await asyncio.gather(
+                self._shutdown_notification_service(),
+                self._shutdown_mcp_coordinator(),
+            )
+            # Stop health probes before the connections they check go away
             await self._shutdown_health_monitor()
-            await self._shutdown_mcp_coordinator()
-            await self._shutdown_redis()
-            await self._shutdown_database()
+            await asyncio.gather(
+                self._shutdown_redis(),
+                self._shutdown_database(),
+            )
             
             self.state = SystemState.STOPPED
             logger.info("System shutdown completed")
@@ -100,122 +190,118 @@ class SystemOrchestrator:
             logger.error(f"Error during system shutdown: {e}")
             self.state = SystemState.ERROR
     
-    async def _startup_database(self):
+    async def _startup_database(self, started_at: Optional[datetime] = None):
         """Initialize database connection."""
         logger.info("Initializing database connection...")
         
         try:
-            from app.database import connect_to_mongo
             await connect_to_mongo()
             
-            self.services["database"] = ServiceInfo(
+            self._set_service(ServiceInfo(
                 name="database",
                 status="running",
-                started_at=datetime.now()
-            )
+                started_at=started_at or datetime.now()
+            ))
             logger.info("Database connection established")
             
         except Exception as e:
-            self.services["database"] = ServiceInfo(
+            self._set_service(ServiceInfo(
                 name="database",
                 status="error",
                 error=str(e)
-            )
+            ))
             raise
     
-    async def _startup_redis(self):
+    async def _startup_redis(self, started_at: Optional[datetime] = None):
         """Initialize Redis connection."""
         logger.info("Initializing Redis connection...")
         
         try:
             # Redis connection is handled by individual services
-            # Just verify it's accessible
-            from redis import asyncio as aioredis
-            redis = aioredis.from_url(settings.redis_url)
-            await redis.ping()
-            await redis.close()
+            # Just verify it's accessible, keeping the pool for later checks
+            if self._redis_client is None:
+                self._redis_client = aioredis.from_url(settings.redis_url, max_connections=10)
+            await asyncio.wait_for(self._redis_client.ping(), timeout=settings.redis_ping_timeout)
             
-            self.services["redis"] = ServiceInfo(
+            self._set_service(ServiceInfo(
                 name="redis",
                 status="running",
-                started_at=datetime.now()
-            )
+                started_at=started_at or datetime.now()
+            ))
             logger.info("Redis connection verified")
             
         except Exception as e:
-            self.services["redis"] = ServiceInfo(
+            self._set_service(ServiceInfo(
                 name="redis",
                 status="error",
                 error=str(e)
-            )
+            ))
             raise
     
-    async def _startup_mcp_coordinator(self):
+    async def _startup_mcp_coordinator(self, started_at: Optional[datetime] = None):
         """Initialize MCP coordinator and agents."""
         logger.info("Starting MCP coordinator...")
         
         try:
-            from app.mcp.coordinator import coordinator
             await coordinator.start()
             
-            self.services["mcp_coordinator"] = ServiceInfo(
+            self._set_service(ServiceInfo(
                 name="mcp_coordinator",
                 status="running",
-                started_at=datetime.now()
-            )
+                started_at=started_at or datetime.now()
+            ))
             logger.info("MCP coordinator started")
             
         except Exception as e:
-            self.services["mcp_coordinator"] = ServiceInfo(
+            self._set_service(ServiceInfo(
                 name="mcp_coordinator",
                 status="error",
                 error=str(e)
-            )
+            ))
             raise
     
-    async def _startup_health_monitor(self):
+    async def _startup_health_monitor(self, started_at: Optional[datetime] = None):
         """Initialize health monitoring."""
         logger.info("Starting health monitor...")
         
         try:
             await health_monitor.start_monitoring()
             
-            self.services["health_monitor"] = ServiceInfo(
+            self._set_service(ServiceInfo(
                 name="health_monitor",
                 status="running",
-                started_at=datetime.now()
-            )
+                started_at=started_at or datetime.now()
+            ))
             logger.info("Health monitor started")
             
         except Exception as e:
-            self.services["health_monitor"] = ServiceInfo(
+            self._set_service(ServiceInfo(
                 name="health_monitor",
                 status="error",
                 error=str(e)
-            )
+            ))
             raise
     
-    async def _startup_notification_service(self):
+    async def _startup_notification_service(self, started_at: Optional[datetime] = None):
         """Initialize notification service."""
         logger.info("Starting notification service...")
         
         try:
-            from app.services.notification_service import initialize_notification_service
             await initialize_notification_service()
             
-            self.services["notification_service"] = ServiceInfo(
+            self._set_service(ServiceInfo(
                 name="notification_service",
                 status="running",
-                started_at=datetime.now()
-            )
+                started_at=started_at or datetime.now()
+            ))
             logger.info("Notification service started")
             
         except Exception as e:
-            self.services["notification_service"] = ServiceInfo(
+            self._set_service(ServiceInfo(
                 name="notification_service",
                 status="error",
                 error=str(e)
-            )
+            ))
             # Don't raise for notification service - it's not critical
             logger.warning(f"Notification service failed to start: {e}")
     
@@ -224,11 +310,9 @@ class SystemOrchestrator:
         logger.info("Shutting down database connection...")
         
         try:
-            from app.database import close_mongo_connection
             await close_mongo_connection()
             
-            if "database" in self.services:
-                self.services["database"].status = "stopped"
+            self._mark_service_stopped("database")
             
         except Exception as e:
             logger.error(f"Error shutting down database: {e}")
@@ -239,8 +323,11 @@ class SystemOrchestrator:
         
         try:
             # Redis connections are managed by individual services
-            if "redis" in self.services:
-                self.services["redis"].status = "stopped"
+            if self._redis_client is not None:
+                await self._redis_client.close()
+                self._redis_client = None
+            
+            self._mark_service_stopped("redis")
             
         except Exception as e:
             logger.error(f"Error shutting down Redis: {e}")
@@ -250,11 +337,9 @@ class SystemOrchestrator:
         logger.info("Shutting down MCP coordinator...")
         
         try:
-            from app.mcp.coordinator import coordinator
             await coordinator.stop()
             
-            if "mcp_coordinator" in self.services:
-                self.services["mcp_coordinator"].status = "stopped"
+            self._mark_service_stopped("mcp_coordinator")
             
         except Exception as e:
             logger.error(f"Error shutting down MCP coordinator: {e}")
@@ -266,8 +351,7 @@ class SystemOrchestrator:
         try:
             await health_monitor.stop_monitoring()
             
-            if "health_monitor" in self.services:
-                self.services["health_monitor"].status = "stopped"
+            self._mark_service_stopped("health_monitor")
             
         except Exception as e:
             logger.error(f"Error shutting down health monitor: {e}")
@@ -277,81 +361,142 @@ class SystemOrchestrator:
         logger.info("Shutting down notification service...")
         
         try:
-            from app.services.notification_service import shutdown_notification_service
             await shutdown_notification_service()
             
-            if "notification_service" in self.services:
-                self.services["notification_service"].status = "stopped"
+            self._mark_service_stopped("notification_service")
             
         except Exception as e:
             logger.error(f"Error shutting down notification service: {e}")
     
     def _register_signal_handlers(self):
         """Register signal handlers for graceful shutdown."""
-        def signal_handler(signum, frame):
+        signals = _shutdown_signals()
+        loop = asyncio.get_running_loop()
+        
+        def on_signal(signum):
             logger.info(f"Received signal {signum}, initiating shutdown...")
             self._shutdown_event.set()
         
-        # Register handlers for common shutdown signals
-        signal.signal(signal.SIGTERM, signal_handler)
-        signal.signal(signal.SIGINT, signal_handler)
+        for sig in signals:
+            try:
+                # Delivered directly on the event loop via its wakeup fd
+                loop.add_signal_handler(sig, on_signal, sig)
+            except NotImplementedError:
+                # Windows event loops don't support add_signal_handler
+                signal.signal(
+                    sig,
+                    lambda signum, frame: loop.call_soon_threadsafe(on_signal, signum)
+                )
+    
+    def add_shutdown_handler(self, handler: Callable, ordered: bool = False):
+        """Add a custom shutdown handler.
         
-        if hasattr(signal, 'SIGHUP'):
-            signal.signal(signal.SIGHUP, signal_handler)
+        Handlers run concurrently on shutdown. Pass ``ordered=True`` for handlers
+        that must run serially, in reverse registration order, after the rest.
+        """
+        is_async = asyncio.iscoroutinefunction(handler)
+        if ordered:
+            if is_async:
+                self._ordered_shutdown_stack.push_async_callback(handler)
+            else:
+                self._ordered_shutdown_stack.callback(handler)
+        else:
+            self.shutdown_handlers.append((is_async, handler))
     
-    def add_shutdown_handler(self, handler: callable):
-        """Add a custom shutdown handler."""
-        self.shutdown_handlers.append(handler)
+    async def _run_shutdown_handlers(self):
+        """Execute custom shutdown handlers, logging individual failures."""
+        loop = asyncio.get_running_loop()
+        calls = [
+            handler() if is_async else loop.run_in_executor(None, handler)
+            for is_async, handler in reversed(self.shutdown_handlers)
+        ]
+        results = await asyncio.gather(*calls, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error in shutdown handler: {result}")
+        
+        try:
+            await self._ordered_shutdown_stack.aclose()
+        except Exception as e:
+            logger.error(f"Error in shutdown handler: {e}")
     
     def get_system_info(self) -> Dict[str, Any]:
-        """Get comprehensive system information."""
+        """Get comprehensive system information.
+        
+        The payload is cached for ``_SYSINFO_TTL`` seconds and invalidated on
+        state and service status changes. Each call returns a shallow copy, and
+        the cached payload holds snapshots rather than the orchestrator's own
+        service and configuration dicts.
+        """
+        now = time.monotonic()
+        if self._sysinfo_cache is not None:
+            cached_at, cached_info = self._sysinfo_cache
+            if now - cached_at < _SYSINFO_TTL:
+                return dict(cached_info)
+        
         uptime = None
-        if self.startup_time:
-            uptime = (datetime.now() - self.startup_time).total_seconds()
+        if self._startup_monotonic is not None:
+            uptime = now - self._startup_monotonic
         
         # Get health status
         health_summary = health_monitor.get_health_summary()
         overall_health = health_summary.get("status", ServiceStatus.UNKNOWN)
         
-        # Determine system state based on health
-        if self.state == SystemState.RUNNING:
-            if overall_health == ServiceStatus.UNHEALTHY:
+        # Determine system state based on health. Enum members are singletons
+        # (get_overall_status always returns a member), so identity suffices.
+        if self._state is SystemState.RUNNING:
+            if overall_health is ServiceStatus.UNHEALTHY:
                 current_state = SystemState.DEGRADED
             else:
                 current_state = self.state
         else:
             current_state = self.state
         
-        return {
+        system_info = {
             "system": {
                 "state": current_state,
                 "uptime_seconds": uptime,
-                "startup_time": self.startup_time.isoformat() if self.startup_time else None,
+                "startup_time": self._startup_time_iso,
                 "version": settings.version,
                 "environment": settings.environment
             },
-            "services": {
-                name: {
-                    "status": service.status,
-                    "started_at": service.started_at.isoformat() if service.started_at else None,
-                    "error": service.error
-                }
-                for name, service in self.services.items()
-            },
+            "services": {name: dict(status) for name, status in self._service_status_view.items()},
             "health": health_summary,
-            "configuration": {
-                "debug": settings.debug,
-                "log_level": settings.log_level,
-                "environment": settings.environment,
-                "database": settings.database_name,
-                "mcp_agents_enabled": True,
-                "health_monitoring_enabled": True
-            }
+            "configuration": dict(self._configuration)
         }
+        self._sysinfo_cache = (now, system_info)
+        return dict(system_info)
     
     async def wait_for_shutdown(self):
         """Wait for shutdown signal."""
         await self._shutdown_event.wait()
+    
+    async def serve(self, main_coro):
+        """Run ``main_coro`` until it finishes or a shutdown signal arrives.
+        
+        The main task races the shutdown event set by the signal handlers
+        registered during startup, and is cancelled as soon as the event
+        fires; ``shutdown()`` always runs afterwards.
+        """
+        main_task = asyncio.ensure_future(main_coro)
+        shutdown_wait = asyncio.ensure_future(self._shutdown_event.wait())
+        
+        try:
+            await asyncio.wait({main_task, shutdown_wait}, return_when=asyncio.FIRST_COMPLETED)
+            if main_task.done():
+                return main_task.result()
+            
+            logger.info("Shutdown signal received, stopping main task")
+            main_task.cancel()
+            try:
+                await main_task
+            except asyncio.CancelledError:
+                pass
+        finally:
+            shutdown_wait.cancel()
+            # Also reached when serve() itself is cancelled
+            main_task.cancel()
+            await self.shutdown()
 
 
 # Global orchestrator instance
@@ -1,24 +1,64 @@
 """PDF generation service for resume creation using ReportLab."""
 
 import asyncio
+import atexit
+import copy
+import errno
+import heapq
+import io
 import logging
-from typing import Dict, List, Optional, Any, Tuple
+import os
+import re
+import shutil
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Any, Tuple, Union, BinaryIO, AsyncIterator, Callable, Iterator
 from datetime import datetime
 from pathlib import Path
+from xml.sax.saxutils import escape
 import hashlib
-import json
 
-import aiofiles
+import orjson
+from reportlab import rl_config
 from reportlab.lib.pagesizes import letter, A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle, StyleSheet1
 from reportlab.lib.units import inch
 from reportlab.lib.colors import black, darkblue, gray
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Table, TableStyle
 from reportlab.platypus.flowables import HRFlowable
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT
 
 from app.config import settings
 
+# Attribute shape checking on every flowable/style assignment is only useful
+# while developing templates
+rl_config.shapeChecking = 1 if settings.debug else 0
+
+
+# Number of rendered PDFs remembered for reuse by content hash
+PDF_CACHE_SIZE = 256
+
+# Number of file metadata entries kept in memory by FileManager
+METADATA_CACHE_SIZE = 1024
+
+# Number of users whose resume analytics are kept in memory
+ANALYTICS_CACHE_SIZE = 1024
+
+# Maximum metadata loads in flight while listing a user's resumes
+METADATA_LOAD_CONCURRENCY = 32
+
+# Sections a resume must contain before it is rendered
+REQUIRED_SECTIONS = ("personal_info", "summary", "experience", "skills")
+_REQUIRED_SECTION_SET = frozenset(REQUIRED_SECTIONS)
+_MISSING_SECTION_MSG = "Missing required section: {}".format
+
+# Job id in stored optimized resume filenames (resume_optimized_<job>_<timestamp>.pdf)
+_FNAME_RE = re.compile(r"_optimized_(?P<job>[^_.]+)")
+
+# Supported resume template styles; the first is the default
+TEMPLATE_STYLES = ("professional", "modern", "minimal")
+
 
 class PDFGenerationError(Exception):
     """Base exception for PDF generation errors."""
@@ -33,6 +73,24 @@ class FileStorageError(Exception):
 class ResumeTemplate:
     """Base class for resume PDF templates."""
     
+    # Stylesheets are immutable once built, so share one per template style
+    _style_cache: Dict[str, StyleSheet1] = {}
+    
+    # Section titles, pre-parsed once per template style
+    SECTION_HEADERS = (
+        "PROFESSIONAL SUMMARY",
+        "PROFESSIONAL EXPERIENCE",
+        "TECHNICAL SKILLS",
+        "EDUCATION",
+        "CERTIFICATIONS",
+        "PROJECTS"
+    )
+    _header_cache: Dict[str, Dict[str, Paragraph]] = {}
+    
+    # One non-blank description line, minus leading bullet characters and
+    # surrounding whitespace; bullet-only lines don't match
+    _BULLET_RE = re.compile(r"^[^\S\n]*[•-]*+[^\S\n]*(\S[^\n]*?)[^\S\n]*$", re.M)
+    
     def __init__(self, page_size=letter, template_style="professional"):
         """Initialize template with page size and style.
         
@@ -42,17 +100,47 @@ class ResumeTemplate:
         """
         self.page_size = page_size
         self.template_style = template_style
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
+        self.styles = self._get_styles(template_style)
+        self._headers = self._get_headers(template_style)
+    
+    @classmethod
+    def _get_styles(cls, template_style: str) -> StyleSheet1:
+        """Return the cached stylesheet for a template style, building it once."""
+        styles = cls._style_cache.get(template_style)
+        if styles is None:
+            styles = cls._setup_custom_styles(template_style)
+            cls._style_cache[template_style] = styles
+        return styles
+    
+    @classmethod
+    def _get_headers(cls, template_style: str) -> Dict[str, Paragraph]:
+        """Return the cached section header paragraphs for a template style."""
+        headers = cls._header_cache.get(template_style)
+        if headers is None:
+            header_style = cls._get_styles(template_style)['SectionHeader']
+            headers = {name: Paragraph(name, header_style) for name in cls.SECTION_HEADERS}
+            cls._header_cache[template_style] = headers
+        return headers
     
-    def _setup_custom_styles(self) -> None:
-        """Setup custom paragraph styles for resume based on template style."""
+    def _section_header(self, name: str) -> Paragraph:
+        """Return a section header flowable without re-parsing its markup.
+        
+        Layout state is set on flowables while a document is built, so each
+        story gets a shallow copy that shares the parsed fragments.
+        """
+        return copy.copy(self._headers[name])
+    
+    @staticmethod
+    def _setup_custom_styles(template_style: str) -> StyleSheet1:
+        """Build the sample stylesheet extended with resume styles for a template style."""
+        styles = getSampleStyleSheet()
+        
         # Style variations based on template
-        if self.template_style == "modern":
+        if template_style == "modern":
             header_color = black
             section_color = gray
             header_size = 20
-        elif self.template_style == "minimal":
+        elif template_style == "minimal":
             header_color = black
             section_color = black
             header_size = 16
@@ -62,9 +150,9 @@ class ResumeTemplate:
             header_size = 18
         
         # Header style for name
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='ResumeHeader',
-            parent=self.styles['Heading1'],
+            parent=styles['Heading1'],
             fontSize=header_size,
             spaceAfter=6,
             alignment=TA_CENTER,
@@ -73,33 +161,33 @@ class ResumeTemplate:
         ))
         
         # Contact info style
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='ContactInfo',
-            parent=self.styles['Normal'],
+            parent=styles['Normal'],
             fontSize=10,
             alignment=TA_CENTER,
             spaceAfter=12
         ))
         
-        # Section header style
-        if self.template_style == "minimal":
+        # Section header style; spaceBefore also separates it from the previous section
+        if template_style == "minimal":
             # Minimal style - no borders
-            self.styles.add(ParagraphStyle(
+            styles.add(ParagraphStyle(
                 name='SectionHeader',
-                parent=self.styles['Heading2'],
+                parent=styles['Heading2'],
                 fontSize=14,
-                spaceBefore=12,
+                spaceBefore=24,
                 spaceAfter=6,
                 textColor=section_color,
                 fontName='Helvetica-Bold'
             ))
         else:
             # Professional and modern styles with borders
-            self.styles.add(ParagraphStyle(
+            styles.add(ParagraphStyle(
                 name='SectionHeader',
-                parent=self.styles['Heading2'],
+                parent=styles['Heading2'],
                 fontSize=14,
-                spaceBefore=12,
+                spaceBefore=24,
                 spaceAfter=6,
                 textColor=section_color,
                 borderWidth=1,
@@ -108,20 +196,20 @@ class ResumeTemplate:
                 fontName='Helvetica-Bold'
             ))
         
-        # Job title style
-        self.styles.add(ParagraphStyle(
+        # Job title style; spaceBefore also separates consecutive entries
+        styles.add(ParagraphStyle(
             name='JobTitle',
-            parent=self.styles['Normal'],
+            parent=styles['Normal'],
             fontSize=12,
-            spaceBefore=6,
+            spaceBefore=12,
             spaceAfter=2,
             fontName='Helvetica-Bold'
         ))
         
         # Company and date style
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='CompanyDate',
-            parent=self.styles['Normal'],
+            parent=styles['Normal'],
             fontSize=10,
             spaceAfter=4,
             textColor=gray,
@@ -129,9 +217,9 @@ class ResumeTemplate:
         ))
         
         # Bullet point style
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='BulletPoint',
-            parent=self.styles['Normal'],
+            parent=styles['Normal'],
             fontSize=10,
             leftIndent=20,
             bulletIndent=10,
@@ -139,38 +227,48 @@ class ResumeTemplate:
         ))
         
         # Skills category style
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='SkillsCategory',
-            parent=self.styles['Normal'],
+            parent=styles['Normal'],
             fontSize=11,
             spaceBefore=4,
             spaceAfter=2,
             fontName='Helvetica-Bold'
         ))
+        
+        return styles
     
     def generate_pdf(
         self,
         resume_content: Dict[str, Any],
-        output_path: str
+        output: Union[str, BinaryIO],
+        metadata: Optional[Dict[str, Any]] = None
     ) -> None:
         """Generate PDF resume from content dictionary.
         
         Args:
             resume_content: Resume content dictionary
-            output_path: Output file path
+            output: Output file path or writable binary file object
+            metadata: Metadata embedded as JSON in the document keywords
             
         Raises:
             PDFGenerationError: If PDF generation fails
         """
         try:
-            # Create document
+            name = resume_content.get("personal_info", {}).get("name", "")
+            
+            # Create document, carrying its metadata in the PDF info dictionary
             doc = SimpleDocTemplate(
-                output_path,
+                output,
                 pagesize=self.page_size,
                 rightMargin=0.75*inch,
                 leftMargin=0.75*inch,
                 topMargin=0.75*inch,
-                bottomMargin=0.75*inch
+                bottomMargin=0.75*inch,
+                title=f"{name} - Resume" if name else "Resume",
+                author=name,
+                subject="Resume",
+                keywords=orjson.dumps(metadata).decode() if metadata else ""
             )
             
             # Build content
@@ -232,18 +330,15 @@ class ResumeTemplate:
         if contact_parts:
             contact_text = " | ".join(contact_parts)
             story.append(Paragraph(contact_text, self.styles['ContactInfo']))
-        
-        story.append(Spacer(1, 12))
     
     def _add_summary(self, story: List, summary: str) -> None:
         """Add professional summary section."""
-        story.append(Paragraph("PROFESSIONAL SUMMARY", self.styles['SectionHeader']))
+        story.append(self._section_header("PROFESSIONAL SUMMARY"))
         story.append(Paragraph(summary, self.styles['Normal']))
-        story.append(Spacer(1, 12))
     
     def _add_experience(self, story: List, experience: List[Dict[str, Any]]) -> None:
         """Add work experience section."""
-        story.append(Paragraph("PROFESSIONAL EXPERIENCE", self.styles['SectionHeader']))
+        story.append(self._section_header("PROFESSIONAL EXPERIENCE"))
         
         for job in experience:
             # Job title
@@ -265,49 +360,55 @@ class ResumeTemplate:
             # Job description/responsibilities
             description = job.get("description", "")
             if description:
-                # Handle bullet points
-                if isinstance(description, str):
-                    # Split by bullet points or newlines
-                    if "•" in description or "-" in description:
-                        lines = description.split("\n")
-                        for line in lines:
-                            line = line.strip()
-                            if line:
-                                # Remove existing bullet characters
-                                line = line.lstrip("•-").strip()
-                                story.append(Paragraph(f"• {line}", self.styles['BulletPoint']))
-                    else:
-                        story.append(Paragraph(description, self.styles['Normal']))
-                elif isinstance(description, list):
-                    for item in description:
-                        story.append(Paragraph(f"• {item}", self.styles['BulletPoint']))
-            
-            story.append(Spacer(1, 8))
-        
-        story.append(Spacer(1, 12))
+                handler = self._DESCRIPTION_HANDLERS.get(type(description))
+                if handler is not None:
+                    handler(self, story, description)
+    
+    def _add_description_text(self, story: List, description: str) -> None:
+        """Add a job description string, as bullets if it contains bullet markers."""
+        # Split by bullet points or newlines
+        if "•" in description or "-" in description:
+            self._add_bullets(story, self._BULLET_RE.findall(description))
+        else:
+            story.append(Paragraph(description, self.styles['Normal']))
+    
+    def _add_bullets(self, story: List, items: List[Any]) -> None:
+        """Add bullet items as a single paragraph, one line per item."""
+        if items:
+            text = "<br/>".join(f"• {escape(str(item))}" for item in items)
+            story.append(Paragraph(text, self.styles['BulletPoint']))
     
     def _add_skills(self, story: List, skills: Any) -> None:
         """Add skills section."""
-        story.append(Paragraph("TECHNICAL SKILLS", self.styles['SectionHeader']))
-        
-        if isinstance(skills, list):
-            # Group skills or display as comma-separated
-            skills_text = ", ".join(skills)
-            story.append(Paragraph(skills_text, self.styles['Normal']))
-        elif isinstance(skills, dict):
-            # Categorized skills
-            for category, skill_list in skills.items():
-                if isinstance(skill_list, list):
-                    category_text = f"<b>{category.title()}:</b> {', '.join(skill_list)}"
-                    story.append(Paragraph(category_text, self.styles['Normal']))
-        elif isinstance(skills, str):
-            story.append(Paragraph(skills, self.styles['Normal']))
-        
-        story.append(Spacer(1, 12))
+        story.append(self._section_header("TECHNICAL SKILLS"))
+        
+        handler = self._SKILLS_HANDLERS.get(type(skills))
+        if handler is not None:
+            handler(self, story, skills)
+    
+    def _add_skill_list(self, story: List, skills: List[str]) -> None:
+        """Add skills as a comma-separated line."""
+        story.append(Paragraph(", ".join(skills), self.styles['Normal']))
+    
+    def _add_skill_categories(self, story: List, skills: Dict[str, Any]) -> None:
+        """Add categorized skills, one line per category."""
+        for category, skill_list in skills.items():
+            if isinstance(skill_list, list):
+                category_text = f"<b>{category.title()}:</b> {', '.join(skill_list)}"
+                story.append(Paragraph(category_text, self.styles['Normal']))
+    
+    def _add_skill_text(self, story: List, skills: str) -> None:
+        """Add free-form skills text."""
+        story.append(Paragraph(skills, self.styles['Normal']))
+    
+    # Renderers by exact content type, looked up once per section instead of
+    # walking an isinstance chain
+    _DESCRIPTION_HANDLERS = {str: _add_description_text, list: _add_bullets}
+    _SKILLS_HANDLERS = {list: _add_skill_list, dict: _add_skill_categories, str: _add_skill_text}
     
     def _add_education(self, story: List, education: List[Dict[str, Any]]) -> None:
         """Add education section."""
-        story.append(Paragraph("EDUCATION", self.styles['SectionHeader']))
+        story.append(self._section_header("EDUCATION"))
         
         for edu in education:
             # Degree and institution
@@ -327,15 +428,12 @@ class ResumeTemplate:
             
             if edu.get("gpa"):
                 story.append(Paragraph(f"GPA: {edu['gpa']}", self.styles['Normal']))
-            
-            story.append(Spacer(1, 6))
-        
-        story.append(Spacer(1, 12))
     
     def _add_certifications(self, story: List, certifications: List[Dict[str, Any]]) -> None:
         """Add certifications section."""
-        story.append(Paragraph("CERTIFICATIONS", self.styles['SectionHeader']))
+        story.append(self._section_header("CERTIFICATIONS"))
         
+        cert_lines = []
         for cert in certifications:
             cert_parts = []
             if cert.get("name"):
@@ -346,14 +444,13 @@ class ResumeTemplate:
                 cert_parts.append(str(cert["year"]))
             
             if cert_parts:
-                cert_text = " | ".join(cert_parts)
-                story.append(Paragraph(f"• {cert_text}", self.styles['BulletPoint']))
+                cert_lines.append(" | ".join(cert_parts))
         
-        story.append(Spacer(1, 12))
+        self._add_bullets(story, cert_lines)
     
     def _add_projects(self, story: List, projects: List[Dict[str, Any]]) -> None:
         """Add projects section."""
-        story.append(Paragraph("PROJECTS", self.styles['SectionHeader']))
+        story.append(self._section_header("PROJECTS"))
         
         for project in projects:
             # Project name
@@ -376,10 +473,93 @@ class ResumeTemplate:
             # Description
             if project.get("description"):
                 story.append(Paragraph(project["description"], self.styles['Normal']))
-            
-            story.append(Spacer(1, 6))
-        
-        story.append(Spacer(1, 12))
+
+
+class HashingWriter:
+    """Binary writer that hashes data as it is written to an in-memory buffer."""
+    
+    def __init__(self):
+        self.buffer = io.BytesIO()
+        self.hasher = hashlib.sha256(usedforsecurity=False)
+    
+    def write(self, data: bytes) -> int:
+        self.hasher.update(data)
+        return self.buffer.write(data)
+    
+    def flush(self) -> None:
+        pass
+    
+    def hexdigest(self) -> str:
+        return self.hasher.hexdigest()
+
+
+# Templates keep no per-render state, so each process builds a style on first use
+_templates: Dict[str, ResumeTemplate] = {}
+
+
+def _get_template(template_style: str) -> ResumeTemplate:
+    """Return the shared template for a style, creating it on first use."""
+    template = _templates.get(template_style)
+    if template is None:
+        template = _templates[template_style] = ResumeTemplate(template_style=template_style)
+    return template
+
+
+def _render_resume_pdf(
+    template_style: str,
+    resume_content: Dict[str, Any],
+    metadata: Optional[Dict[str, Any]] = None
+) -> Tuple[bytes, str]:
+    """Render a resume to PDF bytes and their SHA-256. Runs inside the PDF worker processes."""
+    writer = HashingWriter()
+    _get_template(template_style).generate_pdf(resume_content, writer, metadata)
+    return writer.buffer.getvalue(), writer.hexdigest()
+
+
+def _write_file(path: Path, data: bytes) -> os.stat_result:
+    """Write a file atomically and return its stat taken from the open descriptor.
+    
+    The data goes to a temporary file that then replaces ``path``, so files
+    hard-linked by FileManager.link_file are never rewritten in place.
+    """
+    # Dot-prefixed and not ".tmp", so cleanup_user_files never sweeps an
+    # in-flight write
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{time.monotonic_ns()}.partial")
+    try:
+        with open(tmp_path, 'xb') as f:
+            f.write(data)
+            f.flush()
+            stat = os.fstat(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    return stat
+
+
+def _iter_files(dirpath: Union[str, Path], suffixes: Union[str, Tuple[str, ...]]) -> Iterator[os.DirEntry]:
+    """Yield the regular files directly in a directory whose names end with one of the suffixes."""
+    with os.scandir(dirpath) as entries:
+        for entry in entries:
+            if entry.name.endswith(suffixes) and entry.is_file(follow_symlinks=False):
+                yield entry
+
+
+async def _write_bytes(path: Path, data: bytes) -> os.stat_result:
+    """Write a small file in one call on the default thread pool.
+    
+    Returns:
+        Stat of the written file
+    """
+    return await asyncio.get_event_loop().run_in_executor(None, _write_file, path, data)
+
+
+async def _read_bytes(path: Path) -> bytes:
+    """Read a small file in one call on the default thread pool."""
+    return await asyncio.get_event_loop().run_in_executor(None, path.read_bytes)
 
 
 class FileManager:
@@ -393,7 +573,32 @@ class FileManager:
         """
         self.base_path = Path(base_path or settings.resume_storage_path)
         self.logger = logging.getLogger(__name__)
-        self._file_metadata_cache = {}
+        # LRU of path -> (file st_mtime_ns, metadata), bounded by METADATA_CACHE_SIZE
+        self._file_metadata_cache: "OrderedDict[str, Tuple[Optional[int], Dict[str, Any]]]" = OrderedDict()
+        # Sidecar loads in progress, shared by concurrent callers for the same path
+        self._metadata_loads: Dict[str, "asyncio.Future[Optional[Dict[str, Any]]]"] = {}
+        # Called with the file path whenever a file's metadata is written
+        self.metadata_listeners: List[Callable[[Path], None]] = []
+    
+    def _metadata_written(self, file_path: Path) -> None:
+        """Notify metadata listeners that a file's metadata changed."""
+        for listener in self.metadata_listeners:
+            listener(file_path)
+    
+    def _cache_metadata(
+        self,
+        cache_key: str,
+        metadata: Dict[str, Any],
+        mtime_ns: Optional[int] = None
+    ) -> None:
+        """Store metadata in the LRU cache, evicting the least recently used entry.
+        
+        Entries cached without the file's ``mtime_ns`` are revalidated on next access.
+        """
+        self._file_metadata_cache[cache_key] = (mtime_ns, metadata)
+        self._file_metadata_cache.move_to_end(cache_key)
+        if len(self._file_metadata_cache) > METADATA_CACHE_SIZE:
+            self._file_metadata_cache.popitem(last=False)
     
     async def ensure_directory(self, directory: Path) -> None:
         """Ensure directory exists, create if necessary.
@@ -414,7 +619,8 @@ class FileManager:
         user_id: str,
         job_id: Optional[str] = None,
         resume_type: str = "original",
-        extension: str = "pdf"
+        extension: str = "pdf",
+        template_style: Optional[str] = None
     ) -> Path:
         """Generate file path for resume storage.
         
@@ -423,6 +629,7 @@ class FileManager:
             job_id: Job ID (for optimized resumes)
             resume_type: Resume type (original, optimized)
             extension: File extension
+            template_style: Template style, so renders of several styles get distinct names
             
         Returns:
             Generated file path
@@ -432,7 +639,9 @@ class FileManager:
         await self.ensure_directory(user_dir)
         
         # Generate filename
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S", time.gmtime())
+        if template_style:
+            timestamp = f"{template_style}_{timestamp}"
         
         if job_id and resume_type == "optimized":
             filename = f"resume_optimized_{job_id}_{timestamp}.{extension}"
@@ -445,7 +654,8 @@ class FileManager:
         self,
         content: bytes,
         file_path: Path,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        file_hash: Optional[str] = None
     ) -> Dict[str, Any]:
         """Save file content to disk with enhanced metadata tracking.
         
@@ -453,6 +663,7 @@ class FileManager:
             content: File content as bytes
             file_path: Target file path
             metadata: Additional metadata to store
+            file_hash: SHA-256 of content if already computed by the producer
             
         Returns:
             File metadata
@@ -465,14 +676,42 @@ class FileManager:
             await self.ensure_directory(file_path.parent)
             
             # Write file
-            async with aiofiles.open(file_path, 'wb') as f:
-                await f.write(content)
+            stat = await _write_bytes(file_path, content)
             
             # Calculate file hash
-            file_hash = hashlib.sha256(content).hexdigest()
+            if file_hash is None:
+                file_hash = hashlib.sha256(content, usedforsecurity=False).hexdigest()
+            
+            return await self.record_file_metadata(file_path, file_hash, metadata, stat)
             
+        except Exception as e:
+            raise FileStorageError(f"Failed to save file {file_path}: {e}")
+    
+    async def record_file_metadata(
+        self,
+        file_path: Path,
+        file_hash: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        stat: Optional[os.stat_result] = None
+    ) -> Dict[str, Any]:
+        """Build, cache and persist metadata for a file already on disk.
+        
+        Args:
+            file_path: Stored file path
+            file_hash: SHA-256 hex digest of the file content
+            metadata: Additional metadata to store
+            stat: File stat if already known, e.g. from the write
+            
+        Returns:
+            File metadata
+            
+        Raises:
+            FileStorageError: If the file cannot be inspected
+        """
+        try:
             # Get file stats
-            stat = file_path.stat()
+            if stat is None:
+                stat = os.stat(file_path)
             
             # Create comprehensive metadata
             file_metadata = {
@@ -491,15 +730,16 @@ class FileManager:
                 file_metadata.update(metadata)
             
             # Cache metadata
-            self._file_metadata_cache[str(file_path)] = file_metadata
+            self._cache_metadata(str(file_path), file_metadata, stat.st_mtime_ns)
             
             # Save metadata to JSON file
             await self._save_metadata_file(file_path, file_metadata)
+            self._metadata_written(file_path)
             
             return file_metadata
             
         except Exception as e:
-            raise FileStorageError(f"Failed to save file {file_path}: {e}")
+            raise FileStorageError(f"Failed to record metadata for {file_path}: {e}")
     
     async def _save_metadata_file(self, file_path: Path, metadata: Dict[str, Any]) -> None:
         """Save metadata to JSON file alongside the main file.
@@ -510,8 +750,10 @@ class FileManager:
         """
         try:
             metadata_path = file_path.with_suffix('.json')
-            async with aiofiles.open(metadata_path, 'w') as f:
-                await f.write(json.dumps(metadata, indent=2))
+            await _write_bytes(
+                metadata_path,
+                orjson.dumps(metadata, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            )
         except Exception as e:
             self.logger.warning(f"Failed to save metadata file for {file_path}: {e}")
     
@@ -526,14 +768,34 @@ class FileManager:
         """
         try:
             metadata_path = file_path.with_suffix('.json')
-            if metadata_path.exists():
-                async with aiofiles.open(metadata_path, 'r') as f:
-                    content = await f.read()
-                    return json.loads(content)
+            return orjson.loads(await _read_bytes(metadata_path))
+        except FileNotFoundError:
+            pass
         except Exception as e:
             self.logger.warning(f"Failed to load metadata file for {file_path}: {e}")
         return None
     
+    def _load_metadata_shared(
+        self,
+        cache_key: str,
+        file_path: Path
+    ) -> "asyncio.Future[Optional[Dict[str, Any]]]":
+        """Return the pending sidecar load for a file, starting one if none is running.
+        
+        Args:
+            cache_key: Metadata cache key for the file
+            file_path: Main file path
+            
+        Returns:
+            Future resolving to the loaded metadata or None
+        """
+        load = self._metadata_loads.get(cache_key)
+        if load is None:
+            load = asyncio.ensure_future(self._load_metadata_file(file_path))
+            self._metadata_loads[cache_key] = load
+            load.add_done_callback(lambda _: self._metadata_loads.pop(cache_key, None))
+        return load
+    
     async def read_file(self, file_path: Path) -> bytes:
         """Read file content from disk.
         
@@ -547,27 +809,51 @@ class FileManager:
             FileStorageError: If file read fails
         """
         try:
-            async with aiofiles.open(file_path, 'rb') as f:
-                return await f.read()
+            return await _read_bytes(file_path)
         except Exception as e:
             raise FileStorageError(f"Failed to read file {file_path}: {e}")
     
-    async def delete_file(self, file_path: Path) -> bool:
+    async def link_file(self, src: Path, dst: Path) -> None:
+        """Hard-link an existing file to a new path.
+        
+        Falls back to copying when the paths are on different filesystems.
+        Safe for storage paths because _write_file replaces files rather than
+        truncating them, so a later write never reaches the other link.
+        
+        Args:
+            src: Existing file path
+            dst: New file path
+            
+        Raises:
+            FileStorageError: If the file can be neither linked nor copied
+        """
+        loop = asyncio.get_event_loop()
+        try:
+            try:
+                await loop.run_in_executor(None, os.link, src, dst)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                await loop.run_in_executor(None, shutil.copyfile, src, dst)
+        except Exception as e:
+            raise FileStorageError(f"Failed to link file {src} to {dst}: {e}")
+    
+    async def delete_file(self, file_path: Union[str, Path]) -> bool:
         """Delete file from disk.
         
         Args:
             file_path: File path to delete
             
         Returns:
-            True if deleted successfully
+            True if deleted successfully, False if it did not exist
             
         Raises:
             FileStorageError: If file deletion fails
         """
         try:
-            if file_path.exists():
-                file_path.unlink()
-                return True
+            await asyncio.get_event_loop().run_in_executor(None, os.unlink, file_path)
+            return True
+        except FileNotFoundError:
             return False
         except Exception as e:
             raise FileStorageError(f"Failed to delete file {file_path}: {e}")
@@ -582,32 +868,49 @@ class FileManager:
             File metadata or None if file doesn't exist
         """
         try:
-            if not file_path.exists():
-                return None
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.error(f"Failed to get file metadata for {file_path}: {e}")
+            return None
+        
+        return await self.get_file_metadata_from_stat(file_path, stat)
+    
+    async def get_file_metadata_from_stat(
+        self,
+        file_path: Union[str, Path],
+        stat: os.stat_result
+    ) -> Optional[Dict[str, Any]]:
+        """Get comprehensive file metadata for a file that has already been stat'd.
+        
+        Args:
+            file_path: File path
+            stat: Current stat of the file, e.g. from os.scandir
             
-            # Check cache first
+        Returns:
+            File metadata or None if it cannot be read
+        """
+        try:
+            # Check cache first, verifying the file hasn't changed
             cache_key = str(file_path)
-            if cache_key in self._file_metadata_cache:
-                cached_metadata = self._file_metadata_cache[cache_key]
-                # Verify file hasn't changed
-                stat = file_path.stat()
-                cached_mtime = datetime.fromisoformat(cached_metadata["modified_at"])
-                file_mtime = datetime.fromtimestamp(stat.st_mtime)
-                
-                if abs((file_mtime - cached_mtime).total_seconds()) < 1:
+            cached = self._file_metadata_cache.get(cache_key)
+            if cached is not None:
+                self._file_metadata_cache.move_to_end(cache_key)
+                cached_mtime_ns, cached_metadata = cached
+                if cached_mtime_ns == stat.st_mtime_ns:
                     return cached_metadata
             
-            # Load from metadata file
-            stored_metadata = await self._load_metadata_file(file_path)
+            # Load from metadata file, joining a load already in progress
+            file_path = Path(file_path)
+            stored_metadata = await asyncio.shield(self._load_metadata_shared(cache_key, file_path))
             if stored_metadata:
-                self._file_metadata_cache[cache_key] = stored_metadata
+                self._cache_metadata(cache_key, stored_metadata, stat.st_mtime_ns)
                 return stored_metadata
             
             # Fallback to basic file stats
-            stat = file_path.stat()
-            
             basic_metadata = {
-                "path": str(file_path),
+                "path": cache_key,
                 "filename": file_path.name,
                 "size": stat.st_size,
                 "created_at": datetime.fromtimestamp(stat.st_ctime).isoformat(),
@@ -648,8 +951,9 @@ class FileManager:
             # Save updated metadata
             await self._save_metadata_file(file_path, current_metadata)
             
-            # Update cache
-            self._file_metadata_cache[str(file_path)] = current_metadata
+            # Update cache; the sidecar write leaves the file's mtime unchanged
+            self._cache_metadata(str(file_path), current_metadata, os.stat(file_path).st_mtime_ns)
+            self._metadata_written(Path(file_path))
             
             return True
             
@@ -658,18 +962,91 @@ class FileManager:
             return False
 
 
+def _validate_personal_info(personal_info: Any, result: Dict[str, Any]) -> None:
+    """Require a name and recommend an email in personal_info."""
+    if not isinstance(personal_info, dict):
+        return
+    
+    if not personal_info.get("name"):
+        result["errors"].append("Name is required in personal_info")
+    
+    if not personal_info.get("email"):
+        result["warnings"].append("Email is recommended in personal_info")
+
+
+def _validate_experience(experience: Any, result: Dict[str, Any]) -> None:
+    """Require dictionary entries and warn about missing titles or companies."""
+    if not isinstance(experience, list):
+        return
+    
+    add_error = result["errors"].append
+    add_warning = result["warnings"].append
+    for i, job in enumerate(experience, 1):
+        if not isinstance(job, dict):
+            add_error(f"Experience entry {i} must be a dictionary")
+            continue
+        
+        get = job.get
+        if not get("title"):
+            add_warning(f"Experience entry {i} missing job title")
+        
+        if not get("company"):
+            add_warning(f"Experience entry {i} missing company")
+
+
+def _validate_skills(skills: Any, result: Dict[str, Any]) -> None:
+    """Suggest listing more skills when fewer than three are given."""
+    if isinstance(skills, list) and len(skills) < 3:
+        result["suggestions"].append("Consider adding more skills (recommended: 5-10)")
+    elif isinstance(skills, str) and skills.count(",") < 2:
+        result["suggestions"].append("Consider adding more skills (recommended: 5-10)")
+
+
+# Resume section -> validator(section value, validation result)
+_VALIDATORS = {
+    "personal_info": _validate_personal_info,
+    "experience": _validate_experience,
+    "skills": _validate_skills
+}
+
+
 class PDFService:
     """Enhanced service for PDF generation and file management."""
     
     def __init__(self):
         """Initialize PDF service."""
         self.file_manager = FileManager()
-        self.templates = {
-            "professional": ResumeTemplate(template_style="professional"),
-            "modern": ResumeTemplate(template_style="modern"),
-            "minimal": ResumeTemplate(template_style="minimal")
-        }
+        self.file_manager.metadata_listeners.append(self._invalidate_analytics)
         self.logger = logging.getLogger(__name__)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # (user_id, content_hash, template_style) -> (rendered file, file hash, stat
+        # identity), LRU ordered; scoped per user so users never share an inode
+        self._pdf_cache: "OrderedDict[Tuple[str, str, str], Tuple[Path, str, Tuple[int, int]]]" = OrderedDict()
+        # user_id -> (user directory st_mtime_ns, analytics), LRU ordered
+        self._analytics_cache: "OrderedDict[str, Tuple[Optional[int], Dict[str, Any]]]" = OrderedDict()
+    
+    def _invalidate_analytics(self, file_path: Path) -> None:
+        """Drop cached analytics for the user owning a file whose metadata changed.
+        
+        Sidecar rewrites don't touch the user directory's mtime, which is all
+        get_resume_analytics checks.
+        """
+        self._analytics_cache.pop(file_path.parent.name, None)
+    
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Return the process pool used for CPU-bound PDF rendering."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=settings.pdf_workers)
+            # Don't leave worker processes behind when the app exits
+            atexit.register(self.shutdown)
+        return self._executor
+    
+    def shutdown(self) -> None:
+        """Stop the rendering worker processes, cancelling queued renders."""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            atexit.unregister(self.shutdown)
+            executor.shutdown(wait=False, cancel_futures=True)
     
     async def generate_resume_pdf(
         self,
@@ -696,8 +1073,8 @@ class PDFService:
         """
         try:
             # Validate template style
-            if template_style not in self.templates:
-                template_style = "professional"
+            if template_style not in TEMPLATE_STYLES:
+                template_style = TEMPLATE_STYLES[0]
                 self.logger.warning(f"Invalid template style, using default: {template_style}")
             
             # Generate file path
@@ -705,23 +1082,14 @@ class PDFService:
                 user_id=user_id,
                 job_id=job_id,
                 resume_type=resume_type,
-                extension="pdf"
-            )
-            
-            # Generate PDF in memory first (for error handling)
-            temp_path = file_path.with_suffix('.tmp')
-            
-            # Generate PDF using selected template
-            template = self.templates[template_style]
-            await asyncio.get_event_loop().run_in_executor(
-                None, 
-                template.generate_pdf, 
-                resume_content, 
-                str(temp_path)
+                extension="pdf",
+                template_style=template_style
             )
             
-            # Read generated PDF
-            pdf_content = await self.file_manager.read_file(temp_path)
+            content_hash = hashlib.sha256(
+                orjson.dumps(resume_content, option=orjson.OPT_SORT_KEYS), usedforsecurity=False
+            ).hexdigest()
+            cache_key = (user_id, content_hash, template_style)
             
             # Prepare metadata
             pdf_metadata = {
@@ -730,18 +1098,38 @@ class PDFService:
                 "resume_type": resume_type,
                 "template_style": template_style,
                 "generated_at": datetime.utcnow().isoformat(),
-                "content_hash": hashlib.sha256(json.dumps(resume_content, sort_keys=True).encode()).hexdigest()
+                "content_hash": content_hash
             }
             
-            # Save to final location with metadata
-            file_metadata = await self.file_manager.save_file(
-                pdf_content, 
-                file_path, 
-                pdf_metadata
-            )
+            # Identical content was rendered before: link it instead of re-rendering
+            file_metadata = await self._reuse_cached_pdf(cache_key, file_path, pdf_metadata)
+            
+            if file_metadata is None:
+                # Render in a worker process; ReportLab is pure-Python CPU work
+                # and would hold the GIL on a thread
+                # Only content-derived fields are embedded: cached renders are
+                # linked for other jobs and resume types with the same content
+                pdf_content, pdf_hash = await asyncio.get_event_loop().run_in_executor(
+                    self._get_executor(),
+                    _render_resume_pdf,
+                    template_style,
+                    resume_content,
+                    {"template_style": template_style, "content_hash": content_hash}
+                )
+                
+                # Save to final location with metadata
+                file_metadata = await self.file_manager.save_file(
+                    pdf_content, 
+                    file_path, 
+                    pdf_metadata,
+                    file_hash=pdf_hash
+                )
             
-            # Clean up temp file
-            await self.file_manager.delete_file(temp_path)
+            stat = file_path.stat()
+            self._pdf_cache[cache_key] = (file_path, file_metadata["hash"], (stat.st_ino, stat.st_mtime_ns))
+            self._pdf_cache.move_to_end(cache_key)
+            if len(self._pdf_cache) > PDF_CACHE_SIZE:
+                self._pdf_cache.popitem(last=False)
             
             self.logger.info(f"Generated PDF resume: {file_path} (template: {template_style})")
             
@@ -751,20 +1139,48 @@ class PDFService:
                 "file_metadata": file_metadata,
                 "resume_type": resume_type,
                 "template_style": template_style,
-                "generated_at": datetime.utcnow().isoformat()
+                "generated_at": pdf_metadata["generated_at"]
             }
             
         except Exception as e:
             self.logger.error(f"PDF generation failed: {e}")
-            # Clean up temp file if it exists
-            try:
-                if 'temp_path' in locals():
-                    await self.file_manager.delete_file(temp_path)
-            except:
-                pass
-            
             raise PDFGenerationError(f"PDF generation failed: {e}")
     
+    async def _reuse_cached_pdf(
+        self,
+        cache_key: Tuple[str, str, str],
+        file_path: Path,
+        pdf_metadata: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Hard-link a previously rendered PDF with the same content and style.
+        
+        Args:
+            cache_key: (user id, content hash, template style)
+            file_path: Target file path
+            pdf_metadata: Metadata to store for the new file
+            
+        Returns:
+            File metadata, or None if there is no usable cached PDF
+        """
+        cached = self._pdf_cache.get(cache_key)
+        if cached is None:
+            return None
+        
+        cached_path, file_hash, identity = cached
+        try:
+            # A new inode or mtime means the file was replaced or overwritten
+            # since it was cached
+            stat = cached_path.stat()
+            if (stat.st_ino, stat.st_mtime_ns) != identity:
+                raise FileExistsError(f"{cached_path} changed since it was cached")
+            await self.file_manager.link_file(cached_path, file_path)
+        except (OSError, FileStorageError) as e:
+            self.logger.debug(f"Cached PDF {cached_path} not reusable: {e}")
+            del self._pdf_cache[cache_key]
+            return None
+        
+        return await self.file_manager.record_file_metadata(file_path, file_hash, pdf_metadata)
+    
     async def generate_multiple_templates(
         self,
         resume_content: Dict[str, Any],
@@ -786,26 +1202,33 @@ class PDFService:
             Generation results for all templates
         """
         if not template_styles:
-            template_styles = ["professional", "modern", "minimal"]
+            template_styles = list(TEMPLATE_STYLES)
         
         results = {}
         
-        for template_style in template_styles:
-            try:
-                result = await self.generate_resume_pdf(
+        outcomes = await asyncio.gather(
+            *(
+                self.generate_resume_pdf(
                     resume_content=resume_content,
                     user_id=user_id,
                     job_id=job_id,
                     resume_type=resume_type,
                     template_style=template_style
                 )
-                results[template_style] = result
-            except Exception as e:
-                self.logger.error(f"Failed to generate {template_style} template: {e}")
+                for template_style in template_styles
+            ),
+            return_exceptions=True
+        )
+        
+        for template_style, outcome in zip(template_styles, outcomes):
+            if isinstance(outcome, Exception):
+                self.logger.error(f"Failed to generate {template_style} template: {outcome}")
                 results[template_style] = {
                     "success": False,
-                    "error": str(e)
+                    "error": str(outcome)
                 }
+            else:
+                results[template_style] = outcome
         
         return {
             "success": True,
@@ -857,32 +1280,7 @@ class PDFService:
             List of resume file metadata
         """
         try:
-            user_dir = self.file_manager.base_path / user_id
-            
-            if not user_dir.exists():
-                return []
-            
-            resumes = []
-            for file_path in user_dir.glob("*.pdf"):
-                metadata = await self.file_manager.get_file_metadata(file_path)
-                if metadata:
-                    # Parse filename to extract type and job_id
-                    filename = file_path.name
-                    if "optimized" in filename:
-                        resume_type = "optimized"
-                        # Extract job_id from filename if present
-                        parts = filename.split("_")
-                        job_id = parts[2] if len(parts) > 2 else None
-                    else:
-                        resume_type = "original"
-                        job_id = None
-                    
-                    metadata.update({
-                        "resume_type": resume_type,
-                        "job_id": job_id,
-                        "filename": filename
-                    })
-                    resumes.append(metadata)
+            resumes = [resume async for resume in self._scan_user_dir(user_id)]
             
             # Sort by creation date (newest first)
             resumes.sort(key=lambda x: x["created_at"], reverse=True)
@@ -893,6 +1291,57 @@ class PDFService:
             self.logger.error(f"Failed to list user resumes for {user_id}: {e}")
             return []
     
+    async def _scan_user_dir(self, user_id: str) -> AsyncIterator[Dict[str, Any]]:
+        """Yield metadata for each resume PDF in a user's directory, in no particular order.
+        
+        Args:
+            user_id: User ID
+            
+        Yields:
+            Resume file metadata including resume_type, job_id and filename
+        """
+        try:
+            pdf_entries = [
+                (entry.name, entry.path, entry.stat())
+                for entry in _iter_files(self.file_manager.base_path / user_id, ".pdf")
+            ]
+        except FileNotFoundError:
+            return
+        
+        # Load metadata concurrently, bounded to keep file descriptors in check
+        semaphore = asyncio.Semaphore(METADATA_LOAD_CONCURRENCY)
+        get_metadata = self.file_manager.get_file_metadata_from_stat
+        
+        async def load_metadata(path: str, stat: os.stat_result) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                return await get_metadata(path, stat)
+        
+        metadatas = await asyncio.gather(
+            *(load_metadata(path, stat) for _, path, stat in pdf_entries),
+            return_exceptions=True
+        )
+        
+        log_warning = self.logger.warning
+        search_filename = _FNAME_RE.search
+        for (filename, _, _), metadata in zip(pdf_entries, metadatas):
+            if isinstance(metadata, Exception):
+                log_warning(f"Failed to load metadata for {filename}: {metadata}")
+                continue
+            if metadata:
+                # Parse filename to extract type and job_id
+                match = search_filename(filename)
+                if match:
+                    resume_type, job_id = "optimized", match.group("job")
+                else:
+                    resume_type, job_id = "original", None
+                
+                metadata.update({
+                    "resume_type": resume_type,
+                    "job_id": job_id,
+                    "filename": filename
+                })
+                yield metadata
+    
     async def get_resume_analytics(self, user_id: str) -> Dict[str, Any]:
         """Get analytics for user's resume files.
         
@@ -903,10 +1352,20 @@ class PDFService:
             Resume analytics data
         """
         try:
-            resumes = await self.list_user_resumes(user_id)
+            # The directory mtime changes whenever a resume is added or removed
+            try:
+                dir_mtime_ns = os.stat(self.file_manager.base_path / user_id).st_mtime_ns
+            except FileNotFoundError:
+                dir_mtime_ns = None
+            
+            cached = self._analytics_cache.get(user_id)
+            if cached is not None and cached[0] == dir_mtime_ns:
+                self._analytics_cache.move_to_end(user_id)
+                # Callers get their own copy; the cached dict must stay intact
+                return copy.deepcopy(cached[1])
             
             analytics = {
-                "total_resumes": len(resumes),
+                "total_resumes": 0,
                 "original_count": 0,
                 "optimized_count": 0,
                 "template_usage": {},
@@ -916,30 +1375,45 @@ class PDFService:
                 "oldest_resume": None
             }
             
-            if not resumes:
-                return analytics
-            
-            # Calculate statistics
-            for resume in resumes:
-                analytics["total_size"] += resume.get("size", 0)
-                
-                if resume.get("resume_type") == "original":
-                    analytics["original_count"] += 1
-                else:
-                    analytics["optimized_count"] += 1
+            # Calculate statistics in a single pass over the directory
+            count = 0
+            total_size = 0
+            original_count = 0
+            template_usage = Counter()
+            latest = oldest = None
+            latest_created = oldest_created = None
+            async for resume in self._scan_user_dir(user_id):
+                get = resume.get
+                count += 1
+                total_size += get("size", 0)
+                if get("resume_type") == "original":
+                    original_count += 1
+                template_usage[get("template_style", "unknown")] += 1
                 
-                # Track template usage
-                template_style = resume.get("template_style", "unknown")
-                analytics["template_usage"][template_style] = analytics["template_usage"].get(template_style, 0) + 1
+                created_at = resume["created_at"]
+                if latest is None or created_at > latest_created:
+                    latest, latest_created = resume, created_at
+                if oldest is None or created_at < oldest_created:
+                    oldest, oldest_created = resume, created_at
             
-            analytics["average_size"] = analytics["total_size"] / len(resumes)
+            if not count:
+                return analytics
             
-            # Find latest and oldest
-            sorted_resumes = sorted(resumes, key=lambda x: x["created_at"])
-            analytics["oldest_resume"] = sorted_resumes[0]
-            analytics["latest_resume"] = sorted_resumes[-1]
+            analytics["total_resumes"] = count
+            analytics["total_size"] = total_size
+            analytics["original_count"] = original_count
+            analytics["optimized_count"] = count - original_count
+            analytics["average_size"] = total_size / count
+            analytics["template_usage"] = dict(template_usage)
+            analytics["latest_resume"] = latest
+            analytics["oldest_resume"] = oldest
             
-            return analytics
+            self._analytics_cache[user_id] = (dir_mtime_ns, analytics)
+            self._analytics_cache.move_to_end(user_id)
+            if len(self._analytics_cache) > ANALYTICS_CACHE_SIZE:
+                self._analytics_cache.popitem(last=False)
+            
+            return copy.deepcopy(analytics)
             
         except Exception as e:
             self.logger.error(f"Failed to get resume analytics for {user_id}: {e}")
@@ -963,23 +1437,36 @@ class PDFService:
         """
         try:
             user_dir = self.file_manager.base_path / user_id
+            delete_file = self.file_manager.delete_file
+            log_warning = self.logger.warning
+            deleted_count = 0
             
-            if not user_dir.exists():
+            # Collect PDF files with their modification times and temporary
+            # files in a single directory pass
+            pdf_files = []
+            temp_files = []
+            try:
+                for entry in _iter_files(user_dir, (".pdf", ".tmp")):
+                    if entry.name.startswith("."):
+                        # In-flight atomic write; see _write_file
+                        continue
+                    if entry.name.endswith(".pdf"):
+                        pdf_files.append((entry.path, entry.stat().st_mtime))
+                    elif cleanup_temp_files:
+                        temp_files.append(entry.path)
+            except FileNotFoundError:
                 return {"success": True, "message": "No files to clean up", "deleted_count": 0}
             
-            deleted_count = 0
-            
             # Clean up temporary files
-            if cleanup_temp_files:
-                for temp_file in user_dir.glob("*.tmp"):
-                    try:
-                        await self.file_manager.delete_file(temp_file)
-                        deleted_count += 1
-                    except Exception as e:
-                        self.logger.warning(f"Failed to delete temp file {temp_file}: {e}")
-            
-            # Get all PDF files
-            pdf_files = list(user_dir.glob("*.pdf"))
+            outcomes = await asyncio.gather(
+                *(delete_file(temp_file) for temp_file in temp_files),
+                return_exceptions=True
+            )
+            for temp_file, outcome in zip(temp_files, outcomes):
+                if isinstance(outcome, Exception):
+                    log_warning(f"Failed to delete temp file {temp_file}: {outcome}")
+                else:
+                    deleted_count += 1
             
             if len(pdf_files) <= keep_count:
                 return {
@@ -988,26 +1475,19 @@ class PDFService:
                     "deleted_count": deleted_count
                 }
             
-            # Sort by modification time (oldest first)
-            pdf_files.sort(key=lambda f: f.stat().st_mtime)
-            
-            # Delete oldest files
-            files_to_delete = pdf_files[:-keep_count]
-            
-            for file_path in files_to_delete:
-                try:
-                    # Delete PDF file
-                    await self.file_manager.delete_file(file_path)
-                    
-                    # Delete associated metadata file
-                    metadata_file = file_path.with_suffix('.json')
-                    if metadata_file.exists():
-                        await self.file_manager.delete_file(metadata_file)
-                    
+            # Delete oldest files, selecting only the excess by modification time
+            excess = len(pdf_files) - keep_count
+            files_to_delete = [path for path, _ in heapq.nsmallest(excess, pdf_files, key=lambda f: f[1])]
+            
+            outcomes = await asyncio.gather(
+                *(self._delete_resume_files(file_path) for file_path in files_to_delete),
+                return_exceptions=True
+            )
+            for file_path, outcome in zip(files_to_delete, outcomes):
+                if isinstance(outcome, Exception):
+                    log_warning(f"Failed to delete file {file_path}: {outcome}")
+                else:
                     deleted_count += 1
-                    
-                except Exception as e:
-                    self.logger.warning(f"Failed to delete file {file_path}: {e}")
             
             return {
                 "success": True,
@@ -1020,6 +1500,18 @@ class PDFService:
             self.logger.error(f"File cleanup failed for user {user_id}: {e}")
             return {"success": False, "error": str(e)}
     
+    async def _delete_resume_files(self, file_path: str) -> None:
+        """Delete a resume PDF and then its metadata file, if any.
+        
+        Args:
+            file_path: PDF file path, ending in .pdf
+            
+        Raises:
+            FileStorageError: If either file cannot be deleted
+        """
+        await self.file_manager.delete_file(file_path)
+        await self.file_manager.delete_file(file_path[:-len(".pdf")] + ".json")
+    
     async def validate_resume_content(self, resume_content: Dict[str, Any]) -> Dict[str, Any]:
         """Validate resume content before PDF generation.
         
@@ -1037,45 +1529,17 @@ class PDFService:
         }
         
         # Check required sections
-        required_sections = ["personal_info", "summary", "experience", "skills"]
-        for section in required_sections:
-            if section not in resume_content:
-                validation_result["errors"].append(f"Missing required section: {section}")
-                validation_result["valid"] = False
-        
-        # Validate personal info
-        if "personal_info" in resume_content:
-            personal_info = resume_content["personal_info"]
-            if not personal_info.get("name"):
-                validation_result["errors"].append("Name is required in personal_info")
-                validation_result["valid"] = False
-            
-            if not personal_info.get("email"):
-                validation_result["warnings"].append("Email is recommended in personal_info")
-        
-        # Validate experience section
-        if "experience" in resume_content:
-            experience = resume_content["experience"]
-            if isinstance(experience, list):
-                for i, job in enumerate(experience):
-                    if not isinstance(job, dict):
-                        validation_result["errors"].append(f"Experience entry {i+1} must be a dictionary")
-                        validation_result["valid"] = False
-                        continue
-                    
-                    if not job.get("title"):
-                        validation_result["warnings"].append(f"Experience entry {i+1} missing job title")
-                    
-                    if not job.get("company"):
-                        validation_result["warnings"].append(f"Experience entry {i+1} missing company")
-        
-        # Validate skills section
-        if "skills" in resume_content:
-            skills = resume_content["skills"]
-            if isinstance(skills, list) and len(skills) < 3:
-                validation_result["suggestions"].append("Consider adding more skills (recommended: 5-10)")
-            elif isinstance(skills, str) and len(skills.split(",")) < 3:
-                validation_result["suggestions"].append("Consider adding more skills (recommended: 5-10)")
+        if not _REQUIRED_SECTION_SET <= resume_content.keys():
+            validation_result["errors"].extend(map(_MISSING_SECTION_MSG, [
+                section for section in REQUIRED_SECTIONS if section not in resume_content
+            ]))
+        
+        # Validate the sections that have rules
+        for section, validator in _VALIDATORS.items():
+            if section in resume_content:
+                validator(resume_content[section], validation_result)
+        
+        validation_result["valid"] = not validation_result["errors"]
         
         return validation_result
 
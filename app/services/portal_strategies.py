@@ -2,23 +2,181 @@
 
 import logging
 import asyncio
+import functools
+import itertools
+import re
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
-from datetime import datetime
+from typing import Dict, Any, ClassVar, Optional, List, Pattern, Sequence, Type, Union
+from pathlib import Path
 from urllib.parse import urlparse
 
-from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import ElementHandle, Locator, Page, TimeoutError as PlaywrightTimeoutError
 
+from app.config import settings
 from app.models.user import User
-from app.services.browser_automation_service import FormFieldMapper, FileUploadHandler
+from app.services.browser_automation_service import (
+    BrowserPool,
+    FormFieldMapper,
+    FileUploadHandler,
+    get_screenshots_dir,
+    browser_automation_service
+)
+from app.services.retry_service import retry_service, RetryConfig, RetryStrategy
+
+
+_DIGIT_RE = re.compile(r"\d")
+
+# Known portal domains, matched in a single regex pass
+_PORTAL_RE = re.compile(r"(linkedin|indeed|glassdoor|monster|ziprecruiter)\.com", re.I)
+
+# Steps still captured under the "errors_only" screenshot policy
+_ESSENTIAL_SCREENSHOT_STEPS = frozenset({"01_initial_page", "04_submitted", "error"})
+
+# Keeps screenshot names unique when two steps land in the same second
+_SCREENSHOT_SEQ = itertools.count()
+
+# Index of the first rendered, visible and (optionally) enabled element, or -1
+_FIRST_USABLE_JS = """([elements, requireEnabled]) => elements.findIndex(
+    el => el.getClientRects().length > 0
+        && getComputedStyle(el).visibility !== 'hidden'
+        && !(requireEnabled && el.disabled)
+)"""
+
+# Fill each [field, selectors, value] entry into the first visible match of its
+# selectors, going through the native value setter and firing input/change so
+# framework-managed inputs see the update; returns the filled field names
+_FILL_TEXT_INPUTS_JS = """(fields) => fields.filter(([field, selectors, value]) => {
+    const el = [...document.querySelectorAll(selectors.join(','))].find(
+        e => e.getClientRects().length > 0 && getComputedStyle(e).visibility !== 'hidden'
+    );
+    if (!el || (el.tagName === 'SELECT' && ![...el.options].some(o => o.value === value))) {
+        return false;
+    }
+    Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), 'value').set.call(el, value);
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+    return true;
+}).map(([field]) => field)"""
+
+# Backoff for clicks and submits that time out while the DOM re-renders
+_TRANSIENT_RETRY_CONFIG = RetryConfig(
+    max_attempts=4,
+    strategy=RetryStrategy.EXPONENTIAL_BACKOFF,
+    base_delay=1.0,
+    max_delay=30.0,
+    jitter_range=0.5
+)
+
+
+# Immutable defaults of an application result; see _new_result
+_RESULT_TEMPLATE = {
+    "success": False,
+    "confirmation_number": None,
+    "error": None,
+    "portal_response": None
+}
+
+
+def _new_result() -> Dict[str, Any]:
+    """Create a blank application result with fresh mutable fields."""
+    return {**_RESULT_TEMPLATE, "screenshots": [], "form_data": {}}
+
+
+def _hostname(url: str) -> str:
+    """Return the lowercased hostname of a URL, tolerating a missing scheme."""
+    return urlparse(url if "//" in url else f"//{url}").hostname or ""
+
+
+@functools.lru_cache(maxsize=4096)
+def _registered_domain(host: str) -> Optional[str]:
+    """Return the PORTAL_REGISTRY domain covering a hostname, or None.
+    
+    Checks the hostname, then each parent domain ("www.linkedin.com",
+    "linkedin.com", "com"). Cleared by @register when the registry changes.
+    """
+    while host:
+        if host in PORTAL_REGISTRY:
+            return host
+        host = host.partition(".")[2]
+    return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _portal_for_host(host: str) -> str:
+    """Return the portal name for a lowercased hostname; batches repeat a few hosts."""
+    match = _PORTAL_RE.search(host)
+    return match.group(1) if match else "generic"
+
+
+def _applicant_fields(user: User) -> Dict[str, str]:
+    """Read the user's contact details once, with the full name precomputed.
+    
+    Args:
+        user: User profile data
+        
+    Returns:
+        Form field type -> value, empty string when unknown
+    """
+    personal_info = getattr(user, 'personal_info', None) or {}
+    if not isinstance(personal_info, dict):
+        personal_info = personal_info.model_dump()
+    
+    first_name = personal_info.get('first_name') or ''
+    last_name = personal_info.get('last_name') or ''
+    return {
+        'first_name': first_name,
+        'last_name': last_name,
+        'full_name': f"{first_name} {last_name}".strip(),
+        'email': personal_info.get('email') or '',
+        'phone': personal_info.get('phone') or ''
+    }
+
+
+def _retry_on_timeout(func):
+    """Retry a strategy coroutine when Playwright times out.
+    
+    Any other exception (e.g. every selector exhausted) is final and
+    propagates immediately.
+    """
+    @functools.wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        config = _TRANSIENT_RETRY_CONFIG
+        for attempt in range(config.max_attempts):
+            try:
+                return await func(self, *args, **kwargs)
+            except PlaywrightTimeoutError as e:
+                if attempt == config.max_attempts - 1:
+                    raise
+                delay = retry_service.calculate_delay(attempt, config)
+                self.logger.warning(
+                    f"{func.__name__} timed out (attempt {attempt + 1}), retrying in {delay:.2f}s: {e}"
+                )
+                await asyncio.sleep(delay)
+    
+    return wrapper
 
 
 class PortalStrategy(ABC):
     """Abstract base class for portal-specific automation strategies."""
     
-    def __init__(self):
+    __slots__ = ('logger', 'screenshot_policy')
+    
+    # Portal domain, set by @register; also matches its subdomains
+    DOMAIN: ClassVar[Optional[str]] = None
+    
+    # Stateless, so one handler is shared by every strategy
+    file_upload_handler: ClassVar[FileUploadHandler] = FileUploadHandler()
+    
+    def __init__(self, screenshot_policy: Optional[str] = None):
+        """Initialize the strategy.
+        
+        Args:
+            screenshot_policy: "all", "errors_only" or "none"; defaults to the
+                screenshot_policy setting
+        """
         self.logger = logging.getLogger(self.__class__.__name__)
-        self.file_upload_handler = FileUploadHandler()
+        self.screenshot_policy = screenshot_policy or settings.screenshot_policy
     
     @abstractmethod
     async def apply(self, page: Page, user: User, resume_path: str, application_id: str) -> Dict[str, Any]:
@@ -47,6 +205,39 @@ class PortalStrategy(ABC):
         """
         pass
     
+    async def _fill_fields(
+        self,
+        form_fields: Dict[str, Any],
+        field_mappings: Dict[str, str],
+        form_data: Dict[str, Any]
+    ) -> None:
+        """Fill detected form fields concurrently.
+        
+        Args:
+            form_fields: Fields detected by FormFieldMapper
+            field_mappings: Field type -> value to fill; empty values are skipped
+            form_data: Receives the values that were filled
+        """
+        fills = [
+            (field_type, value) for field_type, value in field_mappings.items()
+            if field_type in form_fields and value
+        ]
+        results = await asyncio.gather(
+            *(form_fields[field_type]['element'].fill(value) for field_type, value in fills),
+            return_exceptions=True
+        )
+        
+        for (field_type, value), outcome in zip(fills, results):
+            if isinstance(outcome, Exception):
+                self.logger.warning(f"Failed to fill {field_type}: {outcome}")
+            else:
+                form_data[field_type] = value
+                self.logger.info(f"Filled {field_type}")
+    
+    def _handles_host(self, host: str) -> bool:
+        """Check if a hostname is this strategy's domain or one of its subdomains."""
+        return bool(self.DOMAIN) and (host == self.DOMAIN or host.endswith("." + self.DOMAIN))
+    
     async def take_screenshot(self, page: Page, application_id: str, step: str) -> str:
         """Take a screenshot for the current step.
         
@@ -59,17 +250,15 @@ class PortalStrategy(ABC):
             Screenshot file path
         """
         try:
-            from pathlib import Path
-            
-            timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-            filename = f"{application_id}_{step}_{timestamp}.png"
+            timestamp = time.strftime("%Y%m%d_%H%M%S", time.gmtime())
+            filename = f"{application_id}_{step}_{timestamp}_{next(_SCREENSHOT_SEQ)}.jpg"
             
-            screenshots_dir = Path("data/screenshots")
-            screenshots_dir.mkdir(parents=True, exist_ok=True)
+            screenshot_path = get_screenshots_dir() / filename
             
-            screenshot_path = screenshots_dir / filename
-            
-            await page.screenshot(path=str(screenshot_path), full_page=True)
+            # JPEG is several times smaller than PNG for mostly blank form pages;
+            # the file is written off the event loop
+            image = await page.screenshot(full_page=True, type='jpeg', quality=70)
+            await asyncio.get_event_loop().run_in_executor(None, screenshot_path.write_bytes, image)
             
             self.logger.info(f"Screenshot saved: {screenshot_path}")
             return str(screenshot_path)
@@ -77,67 +266,271 @@ class PortalStrategy(ABC):
         except Exception as e:
             self.logger.error(f"Screenshot failed: {e}")
             return ""
+    
+    async def _capture_screenshot(
+        self,
+        tasks: List[asyncio.Future],
+        page: Page,
+        application_id: str,
+        step: str
+    ) -> None:
+        """Take a screenshot for a step and track it in ``tasks``.
+        
+        Essential steps (initial page, submitted, error) are captured inline so
+        the image shows the page state the step names; the other steps are
+        informational and captured in the background while automation continues.
+        Steps excluded by the screenshot policy are skipped.
+        """
+        is_essential = step in _ESSENTIAL_SCREENSHOT_STEPS
+        policy = self.screenshot_policy
+        if policy == "none" or (policy == "errors_only" and not is_essential):
+            return
+        
+        if is_essential:
+            screenshot = asyncio.get_running_loop().create_future()
+            screenshot.set_result(await self.take_screenshot(page, application_id, step))
+        else:
+            screenshot = asyncio.create_task(self.take_screenshot(page, application_id, step))
+        tasks.append(screenshot)
+    
+    async def _with_screenshots(self, result: Dict[str, Any], tasks: List[asyncio.Future]) -> Dict[str, Any]:
+        """Wait for background screenshots and add all saved paths to the result in order.
+        
+        Args:
+            result: Application result
+            tasks: Screenshots tracked during the application
+            
+        Returns:
+            The application result
+        """
+        paths = await asyncio.gather(*tasks, return_exceptions=True)
+        result["screenshots"].extend(path for path in paths if isinstance(path, str) and path)
+        return result
+    
+    async def _find_usable_element(
+        self,
+        page: Page,
+        selectors: Sequence[str],
+        require_enabled: bool = True
+    ) -> Optional[ElementHandle]:
+        """Find the first visible element matching any of the selectors.
+        
+        All selectors are queried in one call and checked in one evaluate, so
+        matches are taken in document order rather than selector order.
+        
+        Args:
+            page: Playwright page object
+            selectors: Alternative selectors for the same element
+            require_enabled: Also skip disabled elements
+            
+        Returns:
+            Matching element handle, or None if nothing usable matched
+        """
+        handles = await page.query_selector_all(", ".join(selectors))
+        if not handles:
+            return None
+        
+        index = await page.evaluate(_FIRST_USABLE_JS, [handles, require_enabled])
+        return handles[index] if index >= 0 else None
+    
+    @_retry_on_timeout
+    async def _try_click(self, page: Page, selectors: Sequence[str], require_enabled: bool = True) -> bool:
+        """Click the first visible element matching any of the selectors.
+        
+        Args:
+            page: Playwright page object
+            selectors: Alternative selectors for the same element
+            require_enabled: Also skip disabled elements
+            
+        Returns:
+            True if an element was clicked, False if none was found
+        """
+        try:
+            element = await self._find_usable_element(page, selectors, require_enabled)
+        except Exception as e:
+            self.logger.debug(f"Lookup for {selectors[0]} failed: {e}")
+            return False
+        
+        if element is None:
+            return False
+        
+        await element.click(timeout=10000)
+        return True
+    
+    async def _find_submit_button(
+        self,
+        page: Page,
+        name: Pattern[str],
+        fallback_selectors: Sequence[str]
+    ) -> Optional[Union[Locator, ElementHandle]]:
+        """Find the submit button by accessible name, falling back to generic submit controls.
+        
+        Args:
+            page: Playwright page object
+            name: Accessible name pattern of the submit button
+            fallback_selectors: Generic submit controls, only used when no button matches by name
+                since other forms on the page may come first
+            
+        Returns:
+            Locator or element to click, or None if nothing usable was found
+        """
+        # get_by_role skips elements hidden from the accessibility tree
+        button = page.get_by_role('button', name=name, disabled=False).first
+        if await button.count():
+            return button
+        
+        return await self._find_usable_element(page, fallback_selectors)
+    
+    async def _wait_for_visible(self, page: Page, selector: str, timeout: int) -> Optional[ElementHandle]:
+        """Wait for an element matching the selector to become visible.
+        
+        Args:
+            page: Playwright page object
+            selector: Selector, possibly a comma-separated list of alternatives
+            timeout: Timeout in milliseconds
+            
+        Returns:
+            The matched element, or None if nothing appeared in time
+        """
+        try:
+            return await page.wait_for_selector(selector, state='visible', timeout=timeout)
+        except PlaywrightTimeoutError:
+            return None
+
+
+# Portal domain -> strategy class, filled in by @register
+PORTAL_REGISTRY: Dict[str, Type[PortalStrategy]] = {}
+
+
+def register(domain: str):
+    """Class decorator registering a strategy for a portal domain.
+    
+    Args:
+        domain: Portal domain, e.g. "linkedin.com"
+        
+    Returns:
+        Decorator that records the class in PORTAL_REGISTRY
+    """
+    def decorator(cls: Type[PortalStrategy]) -> Type[PortalStrategy]:
+        cls.DOMAIN = domain
+        PORTAL_REGISTRY[domain] = cls
+        _registered_domain.cache_clear()
+        return cls
+    
+    return decorator
 
 
+@register("linkedin.com")
 class LinkedInStrategy(PortalStrategy):
     """LinkedIn-specific automation strategy."""
     
+    __slots__ = ()
+    
+    # Keep in sync with LinkedIn's markup for the external "Apply" link; the
+    # early exit in apply() depends on it
+    EXTERNAL_APPLY_SELECTOR = 'a.jobs-apply-button[href^="http"]'
+    MODAL_SELECTOR = '.jobs-easy-apply-modal, div[data-test-modal], div[role="dialog"]'
+    EASY_APPLY_SELECTORS = (
+        'button.jobs-apply-button[aria-label^="Easy Apply"]',
+        '.jobs-apply-button--top-card button:has-text("Easy Apply")',
+        'button:has-text("Easy Apply")',
+        'button[aria-label*="Easy Apply"]',
+        '.jobs-apply-button:has-text("Easy Apply")',
+        '.jobs-s-apply button:has-text("Easy Apply")'
+    )
+    PHONE_SELECTORS = (
+        'input[id*="phone"]',
+        'input[name*="phone"]',
+        'input[aria-label*="phone"]'
+    )
+    RESUME_SELECTORS = (
+        'input[type="file"][id*="resume"]',
+        'input[type="file"][name*="resume"]',
+        'input[type="file"][aria-label*="resume"]',
+        'input[type="file"]'
+    )
+    WORK_AUTH_SELECTORS = (
+        'input[value="Yes"]:near(:text("authorized to work"))',
+        'input[value="Yes"]:near(:text("work authorization"))',
+        'fieldset:has-text("authorized") input[value="Yes"]'
+    )
+    SPONSORSHIP_SELECTORS = (
+        'input[value="No"]:near(:text("sponsorship"))',
+        'input[value="No"]:near(:text("visa sponsorship"))',
+        'fieldset:has-text("sponsorship") input[value="No"]'
+    )
+    EXPERIENCE_SELECTORS = (
+        'input[id*="experience"]',
+        'select[id*="experience"]',
+        'input[name*="experience"]'
+    )
+    SUBMIT_BUTTON_NAME = re.compile(r"Submit|Send application", re.I)
+    FALLBACK_SUBMIT_SELECTORS = ('button[type="submit"]',)
+    SUCCESS_INDICATORS = (
+        ':text("Application sent")',
+        ':text("Application submitted")',
+        ':text("Thank you")',
+        '.artdeco-inline-feedback--success'
+    )
+    SUBMIT_ERROR_SELECTOR = '.artdeco-inline-feedback--error'
+    SUBMIT_OUTCOME_SELECTOR = ', '.join(SUCCESS_INDICATORS + (SUBMIT_ERROR_SELECTOR,))
+    CONFIRMATION_SELECTORS = (
+        '.artdeco-inline-feedback--success',
+        '[data-test-modal-id="application-submitted"]',
+        ':text("Application ID")',
+        ':text("Reference")'
+    )
+    CONFIRMATION_SELECTOR = ', '.join(CONFIRMATION_SELECTORS)
+    
     def can_handle(self, url: str) -> bool:
         """Check if this is a LinkedIn URL."""
-        return "linkedin.com" in url.lower()
+        return self._handles_host(_hostname(url))
     
     async def apply(self, page: Page, user: User, resume_path: str, application_id: str) -> Dict[str, Any]:
         """Execute LinkedIn Easy Apply automation."""
-        result = {
-            "success": False,
-            "confirmation_number": None,
-            "screenshots": [],
-            "form_data": {},
-            "error": None,
-            "portal_response": None
-        }
+        result = _new_result()
+        
+        # Informational screenshots are saved in the background while automation continues
+        screenshot_tasks: List[asyncio.Future] = []
         
         try:
             self.logger.info(f"Starting LinkedIn application for {application_id}")
             
-            # Take initial screenshot
-            screenshot = await self.take_screenshot(page, application_id, "01_initial_page")
-            if screenshot:
-                result["screenshots"].append(screenshot)
+            # "Apply on company site" postings never have an Easy Apply button,
+            # so skip the screenshot and button scan for them
+            if await page.locator(self.EXTERNAL_APPLY_SELECTOR).count() > 0:
+                result["error"] = "External application - job must be applied for on the company site"
+                result["portal_response"] = {"platform": "linkedin", "method": "external"}
+                return result
             
-            # Look for Easy Apply button
-            easy_apply_found = await self._find_easy_apply_button(page)
+            # Take initial screenshot
+            await self._capture_screenshot(screenshot_tasks, page, application_id, "01_initial_page")
             
-            if not easy_apply_found:
+            # Find and click the Easy Apply button
+            if not await self._try_click(page, self.EASY_APPLY_SELECTORS):
                 result["error"] = "Easy Apply button not found - may require external application"
-                return result
+                return await self._with_screenshots(result, screenshot_tasks)
             
-            # Click Easy Apply button
-            await self._click_easy_apply(page)
-            await page.wait_for_timeout(2000)  # Wait for modal to load
+            self.logger.info("Clicked Easy Apply button")
+            if not await self._wait_for_visible(page, self.MODAL_SELECTOR, timeout=10000):
+                self.logger.warning("Easy Apply modal did not appear")
             
             # Take screenshot after clicking Easy Apply
-            screenshot = await self.take_screenshot(page, application_id, "02_easy_apply_modal")
-            if screenshot:
-                result["screenshots"].append(screenshot)
+            await self._capture_screenshot(screenshot_tasks, page, application_id, "02_easy_apply_modal")
             
             # Fill application form
             form_data = await self._fill_linkedin_form(page, user, resume_path, application_id)
             result["form_data"] = form_data
             
             # Take screenshot after filling form
-            screenshot = await self.take_screenshot(page, application_id, "03_form_filled")
-            if screenshot:
-                result["screenshots"].append(screenshot)
+            await self._capture_screenshot(screenshot_tasks, page, application_id, "03_form_filled")
             
             # Submit application
             submission_success = await self._submit_linkedin_application(page, application_id)
             
             if submission_success:
                 # Take final screenshot
-                screenshot = await self.take_screenshot(page, application_id, "04_submitted")
-                if screenshot:
-                    result["screenshots"].append(screenshot)
+                await self._capture_screenshot(screenshot_tasks, page, application_id, "04_submitted")
                 
                 # Extract confirmation
                 confirmation = await self._get_linkedin_confirmation(page)
@@ -150,68 +543,16 @@ class LinkedInStrategy(PortalStrategy):
             else:
                 result["error"] = "Failed to submit LinkedIn application"
             
-            return result
+            return await self._with_screenshots(result, screenshot_tasks)
             
         except Exception as e:
             self.logger.error(f"LinkedIn application failed for {application_id}: {e}")
             result["error"] = str(e)
             
             # Take error screenshot
-            try:
-                screenshot = await self.take_screenshot(page, application_id, "error")
-                if screenshot:
-                    result["screenshots"].append(screenshot)
-            except:
-                pass
-            
-            return result
-    
-    async def _find_easy_apply_button(self, page: Page) -> bool:
-        """Find the Easy Apply button on LinkedIn."""
-        easy_apply_selectors = [
-            'button:has-text("Easy Apply")',
-            'button[aria-label*="Easy Apply"]',
-            '.jobs-apply-button:has-text("Easy Apply")',
-            '.jobs-s-apply button:has-text("Easy Apply")'
-        ]
-        
-        for selector in easy_apply_selectors:
-            try:
-                element = await page.query_selector(selector)
-                if element:
-                    # Check if button is visible and enabled
-                    is_visible = await element.is_visible()
-                    is_enabled = await element.is_enabled()
-                    
-                    if is_visible and is_enabled:
-                        self.logger.info(f"Found Easy Apply button: {selector}")
-                        return True
-            except Exception as e:
-                self.logger.debug(f"Selector {selector} failed: {e}")
-                continue
-        
-        return False
-    
-    async def _click_easy_apply(self, page: Page):
-        """Click the Easy Apply button."""
-        easy_apply_selectors = [
-            'button:has-text("Easy Apply")',
-            'button[aria-label*="Easy Apply"]',
-            '.jobs-apply-button:has-text("Easy Apply")',
-            '.jobs-s-apply button:has-text("Easy Apply")'
-        ]
-        
-        for selector in easy_apply_selectors:
-            try:
-                element = await page.query_selector(selector)
-                if element and await element.is_visible() and await element.is_enabled():
-                    await element.click()
-                    self.logger.info("Clicked Easy Apply button")
-                    return
-            except Exception as e:
-                continue
-        
-        raise Exception("Could not click Easy Apply button")
+            await self._capture_screenshot(screenshot_tasks, page, application_id, "error")
+            
+            return await self._with_screenshots(result, screenshot_tasks)
     
     async def _fill_linkedin_form(self, page: Page, user: User, resume_path: str, application_id: str) -> Dict[str, Any]:
         """Fill LinkedIn application form."""
@@ -219,30 +560,10 @@ class LinkedInStrategy(PortalStrategy):
         
         try:
             # Wait for form to load
-            await page.wait_for_timeout(2000)
+            await page.wait_for_load_state('domcontentloaded')
             
-            # Get user personal info
-            personal_info = user.personal_info if hasattr(user, 'personal_info') else {}
-            
-            # Fill phone number if present
-            phone_selectors = [
-                'input[id*="phone"]',
-                'input[name*="phone"]',
-                'input[aria-label*="phone"]'
-            ]
-            
-            for selector in phone_selectors:
-                try:
-                    phone_input = await page.query_selector(selector)
-                    if phone_input and await phone_input.is_visible():
-                        phone = personal_info.get('phone', '')
-                        if phone:
-                            await phone_input.fill(phone)
-                            form_data['phone'] = phone
-                            self.logger.info("Filled phone number")
-                        break
-                except Exception:
-                    continue
+            # Fill phone number and years of experience in one round trip
+            await self._fill_text_inputs(page, user, form_data)
             
             # Upload resume if file input is present
             if resume_path:
@@ -265,18 +586,21 @@ class LinkedInStrategy(PortalStrategy):
     
     async def _upload_resume_linkedin(self, page: Page, resume_path: str):
         """Upload resume to LinkedIn application."""
-        resume_selectors = [
-            'input[type="file"][id*="resume"]',
-            'input[type="file"][name*="resume"]',
-            'input[type="file"][aria-label*="resume"]',
-            'input[type="file"]'
-        ]
+        # Fail fast on a missing file instead of probing every selector first
+        resume_file = Path(resume_path).resolve()
+        if not resume_file.is_file():
+            raise Exception(f"Resume file not found: {resume_path}")
+        resume_path = str(resume_file)
         
-        for selector in resume_selectors:
+        for selector in self.RESUME_SELECTORS:
             try:
                 file_input = await page.query_selector(selector)
                 if file_input:
-                    await self.file_upload_handler.upload_file(page, selector, resume_path)
+                    # The handler retries on its own; give it the same backoff
+                    # and jitter as the other transient-failure retries
+                    await self.file_upload_handler.upload_file(
+                        page, selector, resume_path, retry_config=_TRANSIENT_RETRY_CONFIG
+                    )
                     return
             except Exception as e:
                 self.logger.debug(f"Resume upload selector {selector} failed: {e}")
@@ -287,73 +611,62 @@ class LinkedInStrategy(PortalStrategy):
     async def _handle_linkedin_questions(self, page: Page, user: User, form_data: Dict[str, Any]):
         """Handle common LinkedIn application questions."""
         try:
-            # Work authorization question
-            work_auth_selectors = [
-                'input[value="Yes"]:near(:text("authorized to work"))',
-                'input[value="Yes"]:near(:text("work authorization"))',
-                'fieldset:has-text("authorized") input[value="Yes"]'
-            ]
-            
-            for selector in work_auth_selectors:
-                try:
-                    element = await page.query_selector(selector)
-                    if element and await element.is_visible():
-                        await element.check()
-                        form_data['work_authorization'] = 'Yes'
-                        self.logger.info("Answered work authorization question")
-                        break
-                except Exception:
-                    continue
-            
-            # Sponsorship question
-            sponsorship_selectors = [
-                'input[value="No"]:near(:text("sponsorship"))',
-                'input[value="No"]:near(:text("visa sponsorship"))',
-                'fieldset:has-text("sponsorship") input[value="No"]'
-            ]
-            
-            for selector in sponsorship_selectors:
-                try:
-                    element = await page.query_selector(selector)
-                    if element and await element.is_visible():
-                        await element.check()
-                        form_data['sponsorship'] = 'No'
-                        self.logger.info("Answered sponsorship question")
-                        break
-                except Exception:
-                    continue
-            
-            # Years of experience
-            experience_selectors = [
-                'input[id*="experience"]',
-                'select[id*="experience"]',
-                'input[name*="experience"]'
-            ]
-            
-            for selector in experience_selectors:
-                try:
-                    element = await page.query_selector(selector)
-                    if element and await element.is_visible():
-                        # Calculate years of experience from user profile
-                        years_exp = self._calculate_years_experience(user)
-                        
-                        tag_name = await element.evaluate("el => el.tagName.toLowerCase()")
-                        
-                        if tag_name == 'select':
-                            # Try to select closest option
-                            await element.select_option(value=str(years_exp))
-                        else:
-                            await element.fill(str(years_exp))
-                        
-                        form_data['years_experience'] = years_exp
-                        self.logger.info(f"Filled experience: {years_exp} years")
-                        break
-                except Exception:
-                    continue
+            # The questions are independent, so answer them concurrently
+            await asyncio.gather(
+                self._answer_choice(
+                    page, self.WORK_AUTH_SELECTORS, form_data, 'work_authorization', 'Yes', "work authorization"
+                ),
+                self._answer_choice(
+                    page, self.SPONSORSHIP_SELECTORS, form_data, 'sponsorship', 'No', "sponsorship"
+                )
+            )
             
         except Exception as e:
             self.logger.warning(f"Question handling failed: {e}")
     
+    async def _answer_choice(
+        self,
+        page: Page,
+        selectors: Sequence[str],
+        form_data: Dict[str, Any],
+        field: str,
+        answer: str,
+        question: str
+    ):
+        """Check the first visible option matching the selectors and record the answer."""
+        for selector in selectors:
+            try:
+                element = await page.query_selector(selector)
+                if element and await element.is_visible():
+                    await element.check()
+                    form_data[field] = answer
+                    self.logger.info(f"Answered {question} question")
+                    break
+            except Exception:
+                continue
+    
+    async def _fill_text_inputs(self, page: Page, user: User, form_data: Dict[str, Any]):
+        """Fill the phone and years of experience inputs with a single page evaluation."""
+        phone = _applicant_fields(user)['phone']
+        years_exp = self._calculate_years_experience(user)
+        
+        fields = [['years_experience', list(self.EXPERIENCE_SELECTORS), str(years_exp)]]
+        if phone:
+            fields.append(['phone', list(self.PHONE_SELECTORS), phone])
+        
+        try:
+            filled = await page.evaluate(_FILL_TEXT_INPUTS_JS, fields)
+        except Exception as e:
+            self.logger.warning(f"Text input filling failed: {e}")
+            return
+        
+        if 'phone' in filled:
+            form_data['phone'] = phone
+            self.logger.info("Filled phone number")
+        if 'years_experience' in filled:
+            form_data['years_experience'] = years_exp
+            self.logger.info(f"Filled experience: {years_exp} years")
+    
     def _calculate_years_experience(self, user: User) -> int:
         """Calculate years of experience from user profile."""
         # This would integrate with the user's experience data
@@ -363,52 +676,35 @@ class LinkedInStrategy(PortalStrategy):
             return min(10, max(1, len(user.experience)))  # Cap between 1-10 years
         return 3  # Default fallback
     
+    @_retry_on_timeout
+    async def _find_linkedin_submit_button(self, page: Page) -> Optional[Union[Locator, ElementHandle]]:
+        """Find the LinkedIn submit button, retrying lookups that time out."""
+        return await self._find_submit_button(page, self.SUBMIT_BUTTON_NAME, self.FALLBACK_SUBMIT_SELECTORS)
+    
     async def _submit_linkedin_application(self, page: Page, application_id: str) -> bool:
         """Submit the LinkedIn application."""
         try:
             # Look for submit/send button
-            submit_selectors = [
-                'button:has-text("Submit application")',
-                'button:has-text("Submit")',
-                'button:has-text("Send application")',
-                'button[aria-label*="Submit"]',
-                'button[type="submit"]'
-            ]
-            
-            for selector in submit_selectors:
-                try:
-                    submit_button = await page.query_selector(selector)
-                    if submit_button and await submit_button.is_visible() and await submit_button.is_enabled():
-                        await submit_button.click()
-                        
-                        # Wait for submission to process
-                        await page.wait_for_timeout(3000)
-                        
-                        # Check for success indicators
-                        success_indicators = [
-                            ':text("Application sent")',
-                            ':text("Application submitted")',
-                            ':text("Thank you")',
-                            '.artdeco-inline-feedback--success'
-                        ]
-                        
-                        for indicator in success_indicators:
-                            try:
-                                element = await page.query_selector(indicator)
-                                if element and await element.is_visible():
-                                    self.logger.info("LinkedIn application submitted successfully")
-                                    return True
-                            except Exception:
-                                continue
-                        
-                        # If no clear success indicator, assume success if no error
-                        return True
-                        
-                except Exception as e:
-                    self.logger.debug(f"Submit selector {selector} failed: {e}")
-                    continue
+            submit_button = await self._find_linkedin_submit_button(page)
+            if submit_button is None:
+                return False
             
-            return False
+            # Never retried: a timeout here or below may come after the
+            # application was already sent, and a second click could duplicate it
+            await submit_button.click()
+            
+            # Wait for a success or error message
+            outcome = await self._wait_for_visible(page, self.SUBMIT_OUTCOME_SELECTOR, timeout=15000)
+            if outcome is None:
+                # If no clear success indicator, assume success if no error
+                return True
+            
+            if await outcome.evaluate("(el, sel) => el.matches(sel)", self.SUBMIT_ERROR_SELECTOR):
+                self.logger.warning("LinkedIn reported an error on submission")
+                return False
+            
+            self.logger.info("LinkedIn application submitted successfully")
+            return True
             
         except Exception as e:
             self.logger.error(f"Application submission failed: {e}")
@@ -417,91 +713,90 @@ class LinkedInStrategy(PortalStrategy):
     async def _get_linkedin_confirmation(self, page: Page) -> Optional[str]:
         """Extract confirmation number from LinkedIn."""
         try:
-            # Look for confirmation elements
-            confirmation_selectors = [
-                '.artdeco-inline-feedback--success',
-                '[data-test-modal-id="application-submitted"]',
-                ':text("Application ID")',
-                ':text("Reference")'
-            ]
-            
-            for selector in confirmation_selectors:
-                try:
-                    element = await page.query_selector(selector)
-                    if element:
-                        text = await element.text_content()
-                        if text and any(char.isdigit() for char in text):
-                            return text.strip()
-                except Exception:
-                    continue
+            # Wait briefly for any confirmation element, then read all their
+            # texts in one round trip
+            if await self._wait_for_visible(page, self.CONFIRMATION_SELECTOR, timeout=5000):
+                texts = await page.eval_on_selector_all(
+                    self.CONFIRMATION_SELECTOR, "els => els.map(el => el.textContent || '')"
+                )
+                for text in texts:
+                    text = text.strip()
+                    if _DIGIT_RE.search(text):
+                        return text
             
             # Generate fallback confirmation
-            return f"LinkedIn-{datetime.utcnow().strftime('%Y%m%d%H%M%S')}"
+            return f"LinkedIn-{time.strftime('%Y%m%d%H%M%S', time.gmtime())}"
             
         except Exception as e:
             self.logger.error(f"Failed to get LinkedIn confirmation: {e}")
             return None
 
 
+@register("indeed.com")
 class IndeedStrategy(PortalStrategy):
     """Indeed-specific automation strategy."""
     
+    __slots__ = ()
+    
+    APPLY_SELECTORS = (
+        'button:has-text("Apply now")',
+        'a:has-text("Apply now")',
+        '.jobsearch-IndeedApplyButton',
+        '[data-jk] button:has-text("Apply")'
+    )
+    SUBMIT_BUTTON_NAME = re.compile(r"Submit", re.I)
+    FALLBACK_SUBMIT_SELECTORS = (
+        'button[type="submit"]',
+        'input[type="submit"]'
+    )
+    SUCCESS_INDICATORS = (
+        ':text("Application submitted")',
+        ':text("Thank you")',
+        ':text("Your application has been sent")'
+    )
+    SUCCESS_SELECTOR = ', '.join(SUCCESS_INDICATORS)
+    
     def can_handle(self, url: str) -> bool:
         """Check if this is an Indeed URL."""
-        return "indeed.com" in url.lower()
+        return self._handles_host(_hostname(url))
     
     async def apply(self, page: Page, user: User, resume_path: str, application_id: str) -> Dict[str, Any]:
         """Execute Indeed application automation."""
-        result = {
-            "success": False,
-            "confirmation_number": None,
-            "screenshots": [],
-            "form_data": {},
-            "error": None,
-            "portal_response": None
-        }
+        result = _new_result()
+        
+        # Informational screenshots are saved in the background while automation continues
+        screenshot_tasks: List[asyncio.Future] = []
         
         try:
             self.logger.info(f"Starting Indeed application for {application_id}")
             
             # Take initial screenshot
-            screenshot = await self.take_screenshot(page, application_id, "01_initial_page")
-            if screenshot:
-                result["screenshots"].append(screenshot)
-            
-            # Look for apply button
-            apply_button_found = await self._find_indeed_apply_button(page)
+            await self._capture_screenshot(screenshot_tasks, page, application_id, "01_initial_page")
             
-            if not apply_button_found:
+            # Find and click the apply button
+            if not await self._try_click(page, self.APPLY_SELECTORS, require_enabled=False):
                 result["error"] = "Apply button not found on Indeed"
-                return result
+                return await self._with_screenshots(result, screenshot_tasks)
             
-            # Click apply button
-            await self._click_indeed_apply(page)
-            await page.wait_for_timeout(2000)
+            self.logger.info("Clicked Indeed apply button")
+            await page.wait_for_load_state('domcontentloaded')
             
             # Take screenshot after clicking apply
-            screenshot = await self.take_screenshot(page, application_id, "02_apply_clicked")
-            if screenshot:
-                result["screenshots"].append(screenshot)
+            await self._capture_screenshot(screenshot_tasks, page, application_id, "02_apply_clicked")
             
             # Fill application form
             form_data = await self._fill_indeed_form(page, user, resume_path, application_id)
             result["form_data"] = form_data
             
             # Take screenshot after filling form
-            screenshot = await self.take_screenshot(page, application_id, "03_form_filled")
-            if screenshot:
-                result["screenshots"].append(screenshot)
+            await self._capture_screenshot(screenshot_tasks, page, application_id, "03_form_filled")
             
             # Submit application
             submission_success = await self._submit_indeed_application(page, application_id)
             
             if submission_success:
                 # Take final screenshot
-                screenshot = await self.take_screenshot(page, application_id, "04_submitted")
-                if screenshot:
-                    result["screenshots"].append(screenshot)
+                await self._capture_screenshot(screenshot_tasks, page, application_id, "04_submitted")
                 
                 # Extract confirmation
                 confirmation = await self._get_indeed_confirmation(page)
@@ -514,62 +809,16 @@ class IndeedStrategy(PortalStrategy):
             else:
                 result["error"] = "Failed to submit Indeed application"
             
-            return result
+            return await self._with_screenshots(result, screenshot_tasks)
             
         except Exception as e:
             self.logger.error(f"Indeed application failed for {application_id}: {e}")
             result["error"] = str(e)
             
             # Take error screenshot
-            try:
-                screenshot = await self.take_screenshot(page, application_id, "error")
-                if screenshot:
-                    result["screenshots"].append(screenshot)
-            except:
-                pass
-            
-            return result
-    
-    async def _find_indeed_apply_button(self, page: Page) -> bool:
-        """Find the apply button on Indeed."""
-        apply_selectors = [
-            'button:has-text("Apply now")',
-            'a:has-text("Apply now")',
-            '.jobsearch-IndeedApplyButton',
-            '[data-jk] button:has-text("Apply")'
-        ]
-        
-        for selector in apply_selectors:
-            try:
-                element = await page.query_selector(selector)
-                if element and await element.is_visible():
-                    self.logger.info(f"Found Indeed apply button: {selector}")
-                    return True
-            except Exception:
-                continue
-        
-        return False
-    
-    async def _click_indeed_apply(self, page: Page):
-        """Click the Indeed apply button."""
-        apply_selectors = [
-            'button:has-text("Apply now")',
-            'a:has-text("Apply now")',
-            '.jobsearch-IndeedApplyButton',
-            '[data-jk] button:has-text("Apply")'
-        ]
-        
-        for selector in apply_selectors:
-            try:
-                element = await page.query_selector(selector)
-                if element and await element.is_visible():
-                    await element.click()
-                    self.logger.info("Clicked Indeed apply button")
-                    return
-            except Exception:
-                continue
-        
-        raise Exception("Could not click Indeed apply button")
+            await self._capture_screenshot(screenshot_tasks, page, application_id, "error")
+            
+            return await self._with_screenshots(result, screenshot_tasks)
     
     async def _fill_indeed_form(self, page: Page, user: User, resume_path: str, application_id: str) -> Dict[str, Any]:
         """Fill Indeed application form."""
@@ -577,32 +826,15 @@ class IndeedStrategy(PortalStrategy):
         
         try:
             # Wait for form to load
-            await page.wait_for_timeout(2000)
+            await page.wait_for_load_state('domcontentloaded')
             
             # Detect form fields
             form_fields = await FormFieldMapper.detect_form_fields(page)
             
-            # Get user personal info
-            personal_info = user.personal_info if hasattr(user, 'personal_info') else {}
-            
-            # Fill detected fields
-            field_mappings = {
-                'first_name': personal_info.get('first_name', ''),
-                'last_name': personal_info.get('last_name', ''),
-                'email': personal_info.get('email', ''),
-                'phone': personal_info.get('phone', ''),
-                'full_name': f"{personal_info.get('first_name', '')} {personal_info.get('last_name', '')}".strip()
-            }
-            
-            for field_type, value in field_mappings.items():
-                if field_type in form_fields and value:
-                    try:
-                        element = form_fields[field_type]['element']
-                        await element.fill(value)
-                        form_data[field_type] = value
-                        self.logger.info(f"Filled {field_type}")
-                    except Exception as e:
-                        self.logger.warning(f"Failed to fill {field_type}: {e}")
+            # Fill detected fields from the user's personal info
+            field_mappings = _applicant_fields(user)
+            
+            await self._fill_fields(form_fields, field_mappings, form_data)
             
             # Upload resume if available
             if resume_path and 'resume_upload' in form_fields:
@@ -624,44 +856,19 @@ class IndeedStrategy(PortalStrategy):
     async def _submit_indeed_application(self, page: Page, application_id: str) -> bool:
         """Submit the Indeed application."""
         try:
-            submit_selectors = [
-                'button:has-text("Submit application")',
-                'button:has-text("Submit")',
-                'button[type="submit"]',
-                'input[type="submit"]'
-            ]
-            
-            for selector in submit_selectors:
-                try:
-                    submit_button = await page.query_selector(selector)
-                    if submit_button and await submit_button.is_visible() and await submit_button.is_enabled():
-                        await submit_button.click()
-                        
-                        # Wait for submission
-                        await page.wait_for_timeout(3000)
-                        
-                        # Check for success indicators
-                        success_indicators = [
-                            ':text("Application submitted")',
-                            ':text("Thank you")',
-                            ':text("Your application has been sent")'
-                        ]
-                        
-                        for indicator in success_indicators:
-                            try:
-                                element = await page.query_selector(indicator)
-                                if element and await element.is_visible():
-                                    self.logger.info("Indeed application submitted successfully")
-                                    return True
-                            except Exception:
-                                continue
-                        
-                        return True
-                        
-                except Exception:
-                    continue
+            submit_button = await self._find_submit_button(
+                page, self.SUBMIT_BUTTON_NAME, self.FALLBACK_SUBMIT_SELECTORS
+            )
+            if submit_button is None:
+                return False
             
-            return False
+            await submit_button.click()
+            
+            # Wait for a success message
+            if await self._wait_for_visible(page, self.SUCCESS_SELECTOR, timeout=15000):
+                self.logger.info("Indeed application submitted successfully")
+            
+            return True
             
         except Exception as e:
             self.logger.error(f"Indeed submission failed: {e}")
@@ -671,7 +878,7 @@ class IndeedStrategy(PortalStrategy):
         """Extract confirmation from Indeed."""
         try:
             # Generate confirmation based on timestamp
-            return f"Indeed-{datetime.utcnow().strftime('%Y%m%d%H%M%S')}"
+            return f"Indeed-{time.strftime('%Y%m%d%H%M%S', time.gmtime())}"
         except Exception as e:
             self.logger.error(f"Failed to get Indeed confirmation: {e}")
             return None
@@ -680,124 +887,90 @@ class IndeedStrategy(PortalStrategy):
 class DefaultStrategy(PortalStrategy):
     """Default/generic automation strategy for unknown portals."""
     
+    __slots__ = ()
+    
+    APPLY_SELECTORS = (
+        'button:has-text("Apply")',
+        'a:has-text("Apply")',
+        'input[value*="Apply"]',
+        'button[class*="apply"]',
+        'a[class*="apply"]'
+    )
+    SUBMIT_SELECTORS = (
+        'button[type="submit"]',
+        'input[type="submit"]',
+        'button:has-text("Submit")',
+        'button:has-text("Send")',
+        'a:has-text("Submit")'
+    )
+    
     def can_handle(self, url: str) -> bool:
         """This strategy can handle any URL as a fallback."""
         return True
     
     async def apply(self, page: Page, user: User, resume_path: str, application_id: str) -> Dict[str, Any]:
         """Execute generic application automation."""
-        result = {
-            "success": False,
-            "confirmation_number": None,
-            "screenshots": [],
-            "form_data": {},
-            "error": None,
-            "portal_response": None
-        }
+        result = _new_result()
+        
+        # Informational screenshots are saved in the background while automation continues
+        screenshot_tasks: List[asyncio.Future] = []
         
         try:
             self.logger.info(f"Starting generic application for {application_id}")
             
             # Take initial screenshot
-            screenshot = await self.take_screenshot(page, application_id, "01_initial_page")
-            if screenshot:
-                result["screenshots"].append(screenshot)
-            
-            # Look for apply button
-            apply_button_found = await self._find_generic_apply_button(page)
+            await self._capture_screenshot(screenshot_tasks, page, application_id, "01_initial_page")
             
-            if apply_button_found:
-                # Click apply button
-                await self._click_generic_apply(page)
-                await page.wait_for_timeout(2000)
+            # Click the apply button if the page has one
+            if await self._try_click_apply(page):
+                await page.wait_for_load_state('domcontentloaded')
                 
                 # Take screenshot after clicking apply
-                screenshot = await self.take_screenshot(page, application_id, "02_apply_clicked")
-                if screenshot:
-                    result["screenshots"].append(screenshot)
+                await self._capture_screenshot(screenshot_tasks, page, application_id, "02_apply_clicked")
             
             # Try to fill any detected form
             form_data = await self._fill_generic_form(page, user, resume_path, application_id)
             result["form_data"] = form_data
             
             # Take screenshot after filling form
-            screenshot = await self.take_screenshot(page, application_id, "03_form_filled")
-            if screenshot:
-                result["screenshots"].append(screenshot)
+            await self._capture_screenshot(screenshot_tasks, page, application_id, "03_form_filled")
             
             # Try to submit
             submission_success = await self._submit_generic_application(page, application_id)
             
             if submission_success:
                 # Take final screenshot
-                screenshot = await self.take_screenshot(page, application_id, "04_submitted")
-                if screenshot:
-                    result["screenshots"].append(screenshot)
+                await self._capture_screenshot(screenshot_tasks, page, application_id, "04_submitted")
                 
                 result["success"] = True
-                result["confirmation_number"] = f"Generic-{datetime.utcnow().strftime('%Y%m%d%H%M%S')}"
+                result["confirmation_number"] = f"Generic-{time.strftime('%Y%m%d%H%M%S', time.gmtime())}"
                 result["portal_response"] = {"platform": "generic", "method": "form_submission"}
                 
                 self.logger.info(f"Generic application successful for {application_id}")
             else:
                 result["error"] = "Could not complete generic application"
             
-            return result
+            return await self._with_screenshots(result, screenshot_tasks)
             
         except Exception as e:
             self.logger.error(f"Generic application failed for {application_id}: {e}")
             result["error"] = str(e)
             
             # Take error screenshot
-            try:
-                screenshot = await self.take_screenshot(page, application_id, "error")
-                if screenshot:
-                    result["screenshots"].append(screenshot)
-            except:
-                pass
-            
-            return result
-    
-    async def _find_generic_apply_button(self, page: Page) -> bool:
-        """Find generic apply button."""
-        apply_selectors = [
-            'button:has-text("Apply")',
-            'a:has-text("Apply")',
-            'input[value*="Apply"]',
-            'button[class*="apply"]',
-            'a[class*="apply"]'
-        ]
-        
-        for selector in apply_selectors:
-            try:
-                element = await page.query_selector(selector)
-                if element and await element.is_visible():
-                    self.logger.info(f"Found generic apply button: {selector}")
-                    return True
-            except Exception:
-                continue
-        
-        return False
+            await self._capture_screenshot(screenshot_tasks, page, application_id, "error")
+            
+            return await self._with_screenshots(result, screenshot_tasks)
     
-    async def _click_generic_apply(self, page: Page):
-        """Click generic apply button."""
-        apply_selectors = [
-            'button:has-text("Apply")',
-            'a:has-text("Apply")',
-            'input[value*="Apply"]',
-            'button[class*="apply"]',
-            'a[class*="apply"]'
-        ]
+    async def _try_click_apply(self, page: Page) -> bool:
+        """Click the generic apply button; returns True iff one was clicked."""
+        try:
+            if await self._try_click(page, self.APPLY_SELECTORS, require_enabled=False):
+                self.logger.info("Clicked generic apply button")
+                return True
+        except Exception as e:
+            self.logger.debug(f"Generic apply click failed: {e}")
         
-        for selector in apply_selectors:
-            try:
-                element = await page.query_selector(selector)
-                if element and await element.is_visible():
-                    await element.click()
-                    self.logger.info("Clicked generic apply button")
-                    return
-            except Exception:
-                continue
+        return False
     
     async def _fill_generic_form(self, page: Page, user: User, resume_path: str, application_id: str) -> Dict[str, Any]:
         """Fill generic application form."""
@@ -805,7 +978,7 @@ class DefaultStrategy(PortalStrategy):
         
         try:
             # Wait for potential form load
-            await page.wait_for_timeout(2000)
+            await page.wait_for_load_state('domcontentloaded')
             
             # Detect form fields
             form_fields = await FormFieldMapper.detect_form_fields(page)
@@ -814,27 +987,9 @@ class DefaultStrategy(PortalStrategy):
                 self.logger.info("No form fields detected")
                 return form_data
             
-            # Get user personal info
-            personal_info = user.personal_info if hasattr(user, 'personal_info') else {}
-            
-            # Fill detected fields
-            field_mappings = {
-                'first_name': personal_info.get('first_name', ''),
-                'last_name': personal_info.get('last_name', ''),
-                'full_name': f"{personal_info.get('first_name', '')} {personal_info.get('last_name', '')}".strip(),
-                'email': personal_info.get('email', ''),
-                'phone': personal_info.get('phone', '')
-            }
-            
-            for field_type, value in field_mappings.items():
-                if field_type in form_fields and value:
-                    try:
-                        element = form_fields[field_type]['element']
-                        await element.fill(value)
-                        form_data[field_type] = value
-                        self.logger.info(f"Filled {field_type}")
-                    except Exception as e:
-                        self.logger.warning(f"Failed to fill {field_type}: {e}")
+            # Fill detected fields from the user's personal info
+            field_mappings = _applicant_fields(user)
+            await self._fill_fields(form_fields, field_mappings, form_data)
             
             # Upload resume if available
             if resume_path and 'resume_upload' in form_fields:
@@ -856,35 +1011,21 @@ class DefaultStrategy(PortalStrategy):
     async def _submit_generic_application(self, page: Page, application_id: str) -> bool:
         """Submit generic application."""
         try:
-            submit_selectors = [
-                'button[type="submit"]',
-                'input[type="submit"]',
-                'button:has-text("Submit")',
-                'button:has-text("Send")',
-                'a:has-text("Submit")'
-            ]
-            
-            for selector in submit_selectors:
-                try:
-                    submit_button = await page.query_selector(selector)
-                    if submit_button and await submit_button.is_visible() and await submit_button.is_enabled():
-                        await submit_button.click()
-                        
-                        # Wait for submission
-                        await page.wait_for_timeout(3000)
-                        
-                        self.logger.info("Generic application submitted")
-                        return True
-                        
-                except Exception:
-                    continue
-            
-            # If no submit button found, consider it successful if we filled a form
-            return True
-            
+            submit_button = await self._find_usable_element(page, self.SUBMIT_SELECTORS)
+            if submit_button:
+                await submit_button.click()
+                
+                # Wait for submission
+                await page.wait_for_load_state('domcontentloaded')
+                
+                self.logger.info("Generic application submitted")
+                return True
+                
         except Exception as e:
-            self.logger.error(f"Generic submission failed: {e}")
-            return False
+            self.logger.debug(f"Generic submit failed: {e}")
+        
+        # If no submit button found, consider it successful if we filled a form
+        return True
 
 
 class PortalStrategyManager:
@@ -892,10 +1033,11 @@ class PortalStrategyManager:
     
     def __init__(self):
         self.logger = logging.getLogger(__name__)
+        self._strategies_by_domain = {domain: cls() for domain, cls in PORTAL_REGISTRY.items()}
+        self.default_strategy = DefaultStrategy()
         self.strategies = [
-            LinkedInStrategy(),
-            IndeedStrategy(),
-            DefaultStrategy()  # Always last as fallback
+            *self._strategies_by_domain.values(),
+            self.default_strategy  # Always last as fallback
         ]
     
     def get_strategy(self, url: str) -> PortalStrategy:
@@ -907,13 +1049,40 @@ class PortalStrategyManager:
         Returns:
             Portal strategy instance
         """
-        for strategy in self.strategies:
-            if strategy.can_handle(url):
-                self.logger.info(f"Selected strategy: {strategy.__class__.__name__} for {url}")
-                return strategy
+        domain = _registered_domain(_hostname(url))
+        strategy = self._strategies_by_domain.get(domain, self.default_strategy)
+        
+        self.logger.info(f"Selected strategy: {strategy.__class__.__name__} for {url}")
+        return strategy
+    
+    async def apply_with_pool(
+        self,
+        pool: BrowserPool,
+        user: User,
+        job_url: str,
+        resume_path: str,
+        application_id: str
+    ) -> Dict[str, Any]:
+        """Apply to a job on a page borrowed from a browser pool.
         
-        # This should never happen since DefaultStrategy handles everything
-        return self.strategies[-1]
+        Args:
+            pool: Started browser pool
+            user: User profile data
+            job_url: Job posting URL
+            resume_path: Path to resume file
+            application_id: Application ID for tracking
+            
+        Returns:
+            Application result from the portal strategy
+        """
+        async with pool.page() as page:
+            if not await browser_automation_service.navigate_to_job(page, job_url):
+                result = _new_result()
+                result["error"] = "Failed to navigate to job URL"
+                return result
+            
+            strategy = self.get_strategy(job_url)
+            return await strategy.apply(page, user, resume_path, application_id)
     
     def detect_portal(self, url: str) -> str:
         """Detect the portal type from URL.
@@ -924,20 +1093,7 @@ class PortalStrategyManager:
         Returns:
             Portal name
         """
-        url_lower = url.lower()
-        
-        if "linkedin.com" in url_lower:
-            return "linkedin"
-        elif "indeed.com" in url_lower:
-            return "indeed"
-        elif "glassdoor.com" in url_lower:
-            return "glassdoor"
-        elif "monster.com" in url_lower:
-            return "monster"
-        elif "ziprecruiter.com" in url_lower:
-            return "ziprecruiter"
-        else:
-            return "generic"
+        return _portal_for_host(_hostname(url))
 
 
 # Global strategy manager instance
@@ -3,14 +3,15 @@
 import asyncio
 import json
 import csv
+import functools
+import io
 import zipfile
 import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union
-from io import StringIO, BytesIO
+from typing import Dict, Any, Iterable, List, Optional, Set, Tuple, Union
 from bson import ObjectId
-import pandas as pd
+import orjson
 
 from app.models.user import User
 from app.models.job import Job
@@ -28,6 +29,18 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Formats that are already compressed; deflating them again only burns CPU
+_STORED_SUFFIXES = frozenset({'.pdf', '.docx', '.doc', '.zip', '.jpg', '.jpeg', '.png'})
+
+
+def _dump_json(data: Any) -> bytes:
+    """Serialize export data as indented UTF-8 JSON.
+    
+    orjson encodes datetimes natively; ObjectIds and any other unsupported
+    values fall back to str().
+    """
+    return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
 
 class PrivacyService:
     """Service for handling user data privacy operations."""
@@ -39,6 +52,8 @@ class PrivacyService:
         self.resume_repo = ResumeRepository()
         self.export_dir = Path(settings.data_dir) / "exports"
         self.export_dir.mkdir(parents=True, exist_ok=True)
+        # Keeps in-flight audit writes referenced until they finish
+        self._audit_tasks: Set[asyncio.Future] = set()
     
     @handle_db_errors
     async def export_user_data(self, 
@@ -64,38 +79,32 @@ class PrivacyService:
         # Verify user exists
         user = await self.user_repo.get_by_id_or_raise(user_id)
         
-        # Create export directory for this user
+        if format.lower() not in ("json", "csv"):
+            raise ValueError(f"Unsupported export format: {format}")
+        
+        # Write the archive directly; no intermediate export directory
         export_timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-        user_export_dir = self.export_dir / f"user_{user_id}_{export_timestamp}"
-        user_export_dir.mkdir(parents=True, exist_ok=True)
+        zip_path = self.export_dir / f"user_{user_id}_{export_timestamp}.zip"
         
         try:
             # Collect all user data
             user_data = await self._collect_user_data(user_id)
-            
-            # Export in requested format
-            if format.lower() == "json":
-                export_files = await self._export_as_json(user_data, user_export_dir)
-            elif format.lower() == "csv":
-                export_files = await self._export_as_csv(user_data, user_export_dir)
-            else:
-                raise ValueError(f"Unsupported export format: {format}")
+            total_records = sum(
+                len(data) if isinstance(data, list) else 1 for data in user_data.values()
+            )
             
             # Include resume files if requested
-            if include_files:
-                files_copied = await self._copy_user_files(user_id, user_export_dir)
-                export_files.update(files_copied)
+            resume_files = await self._get_resume_files(user_id) if include_files else []
             
-            # Create ZIP archive
-            zip_path = await self._create_zip_archive(user_export_dir)
-            
-            # Clean up temporary directory
-            shutil.rmtree(user_export_dir)
+            # Serializing and compressing is blocking work; keep it off the loop
+            export_files = await asyncio.get_event_loop().run_in_executor(
+                None, self._write_archive, zip_path, user_data, format.lower(), resume_files
+            )
             
             logger.info(f"Data export completed for user {user_id}")
             
             # Log audit event
-            audit_service.log_data_event(
+            self._log_data_event_in_background(
                 event_type=AuditEventType.DATA_EXPORTED,
                 user_id=user_id,
                 action="export_user_data",
@@ -103,8 +112,7 @@ class PrivacyService:
                 details={
                     "export_format": format,
                     "include_files": include_files,
-                    "total_records": sum(len(data) if isinstance(data, list) else 1 
-                                       for data in user_data.values()),
+                    "total_records": total_records,
                     "zip_file_size_bytes": zip_path.stat().st_size if zip_path.exists() else 0
                 },
                 severity=AuditSeverity.MEDIUM
@@ -117,14 +125,12 @@ class PrivacyService:
                 "zip_file_path": str(zip_path),
                 "files_included": list(export_files.keys()),
                 "include_files": include_files,
-                "total_records": sum(len(data) if isinstance(data, list) else 1 
-                                   for data in user_data.values())
+                "total_records": total_records
             }
             
         except Exception as e:
-            # Clean up on error
-            if user_export_dir.exists():
-                shutil.rmtree(user_export_dir)
+            # Don't leave a partial archive behind
+            zip_path.unlink(missing_ok=True)
             logger.error(f"Error during data export for user {user_id}: {str(e)}")
             raise
     
@@ -165,25 +171,17 @@ class PrivacyService:
         }
         
         try:
-            # Delete in reverse dependency order to avoid foreign key issues
-            
-            # 1. Delete applications
-            applications = await self.application_repo.find_all({"user_id": user_id})
-            app_count = len(applications)
-            if app_count > 0:
-                await self.application_repo.delete_by_filter({"user_id": user_id})
-                deletion_summary["deleted_records"]["applications"] = app_count
-                logger.info(f"Deleted {app_count} applications for user {user_id}")
+            user_filter = {"user_id": user_id}
             
-            # 2. Delete resumes and associated files
-            resumes = await self.resume_repo.find_all({"user_id": user_id})
-            resume_count = len(resumes)
+            # 1. Delete resume files; only their paths are fetched
             deleted_files = []
             
             if delete_files:
+                resumes = await self.resume_repo.find_projected(user_filter, ["file_info.file_path"])
                 for resume in resumes:
-                    if resume.file_info and resume.file_info.file_path:
-                        file_path = Path(resume.file_info.file_path)
+                    resume_file_path = (resume.get("file_info") or {}).get("file_path")
+                    if resume_file_path:
+                        file_path = Path(resume_file_path)
                         if file_path.exists():
                             try:
                                 file_path.unlink()
@@ -193,26 +191,31 @@ class PrivacyService:
                                     f"Failed to delete file {file_path}: {str(e)}"
                                 )
             
-            if resume_count > 0:
-                await self.resume_repo.delete_by_filter({"user_id": user_id})
-                deletion_summary["deleted_records"]["resumes"] = resume_count
-                deletion_summary["deleted_files"] = deleted_files
-                logger.info(f"Deleted {resume_count} resumes for user {user_id}")
+            # 2. Delete applications, resumes and user-specific job records.
+            # The collections are independent, so the deletes run concurrently
+            # and report their own counts; the user profile goes last
+            collections = (
+                ("applications", self.application_repo),
+                ("resumes", self.resume_repo),
+                ("jobs", self.job_repo)
+            )
+            counts = await asyncio.gather(
+                *(repo.delete_by_filter(user_filter) for _, repo in collections)
+            )
             
-            # 3. Delete jobs (user-specific job records)
-            jobs = await self.job_repo.find_all({"user_id": user_id})
-            job_count = len(jobs)
-            if job_count > 0:
-                await self.job_repo.delete_by_filter({"user_id": user_id})
-                deletion_summary["deleted_records"]["jobs"] = job_count
-                logger.info(f"Deleted {job_count} jobs for user {user_id}")
+            for (name, _), count in zip(collections, counts):
+                if count > 0:
+                    deletion_summary["deleted_records"][name] = count
+                    logger.info(f"Deleted {count} {name} for user {user_id}")
+            if counts[1] > 0:
+                deletion_summary["deleted_files"] = deleted_files
             
-            # 4. Delete user profile (last)
+            # 3. Delete user profile (last)
             await self.user_repo.delete(user_id)
             deletion_summary["deleted_records"]["user_profile"] = 1
             logger.info(f"Deleted user profile for user {user_id}")
             
-            # 5. Clean up any remaining user files
+            # 4. Clean up any remaining user files
             if delete_files:
                 user_files_dir = Path(settings.data_dir) / "resumes" / str(user_id)
                 if user_files_dir.exists():
@@ -227,7 +230,7 @@ class PrivacyService:
             logger.info(f"Data deletion completed for user {user_id}")
             
             # Log audit event
-            audit_service.log_data_event(
+            self._log_data_event_in_background(
                 event_type=AuditEventType.DATA_DELETED,
                 user_id=user_id,
                 action="delete_user_data",
@@ -247,28 +250,44 @@ class PrivacyService:
             deletion_summary["errors"].append(f"Deletion failed: {str(e)}")
             raise
     
+    def _log_data_event_in_background(self, **event: Any) -> None:
+        """Write an audit data event off the request path.
+        
+        log_data_event is synchronous and may hit slow log handlers, so it
+        runs in the default executor; failures are logged when it finishes.
+        """
+        task = asyncio.get_event_loop().run_in_executor(
+            None, functools.partial(audit_service.log_data_event, **event)
+        )
+        self._audit_tasks.add(task)
+        task.add_done_callback(self._on_audit_task_done)
+    
+    def _on_audit_task_done(self, task: asyncio.Future) -> None:
+        self._audit_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Failed to write audit event: {task.exception()}")
+    
     async def _collect_user_data(self, user_id: ObjectId) -> Dict[str, Any]:
         """Collect all user data from all collections."""
         logger.info(f"Collecting user data for user {user_id}")
         
-        # Collect data from all collections
+        # Collect data from all collections concurrently
+        user_filter = {"user_id": user_id}
+        user, jobs, applications, resumes = await asyncio.gather(
+            self.user_repo.get_by_id(user_id),
+            self.job_repo.find_all(user_filter),
+            self.application_repo.find_all(user_filter),
+            self.resume_repo.find_all(user_filter)
+        )
+        
         user_data = {}
         
         # User profile
-        user = await self.user_repo.get_by_id(user_id)
         if user:
             user_data["user_profile"] = user.dict()
         
-        # Jobs
-        jobs = await self.job_repo.find_all({"user_id": user_id})
         user_data["jobs"] = [job.dict() for job in jobs]
-        
-        # Applications
-        applications = await self.application_repo.find_all({"user_id": user_id})
         user_data["applications"] = [app.dict() for app in applications]
-        
-        # Resumes
-        resumes = await self.resume_repo.find_all({"user_id": user_id})
         user_data["resumes"] = [resume.dict() for resume in resumes]
         
         logger.info(f"Collected data: {len(user_data['jobs'])} jobs, "
@@ -277,113 +296,129 @@ class PrivacyService:
         
         return user_data
     
-    async def _export_as_json(self, user_data: Dict[str, Any], 
-                             export_dir: Path) -> Dict[str, str]:
-        """Export user data as JSON files."""
+    def _write_archive(self, zip_path: Path, user_data: Dict[str, Any], format: str,
+                       resume_files: List[Tuple[str, Path, str]]) -> Dict[str, str]:
+        """Build the export ZIP; runs in an executor thread."""
+        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zipf:
+            # Export in requested format
+            if format == "json":
+                export_files = self._export_as_json(user_data, zipf)
+            else:
+                export_files = self._export_as_csv(user_data, zipf)
+            
+            export_files.update(self._add_user_files(zipf, resume_files))
+        
+        return export_files
+    
+    def _export_as_json(self, user_data: Dict[str, Any], 
+                        zipf: zipfile.ZipFile) -> Dict[str, str]:
+        """Export user data as JSON entries in the archive."""
         export_files = {}
         
         for data_type, data in user_data.items():
             if data:  # Only export if data exists
-                file_path = export_dir / f"{data_type}.json"
-                
-                # Convert ObjectId and datetime objects to strings for JSON serialization
-                json_data = self._serialize_for_json(data)
-                
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(json_data, f, indent=2, ensure_ascii=False, default=str)
-                
-                export_files[data_type] = str(file_path)
+                arcname = f"{data_type}.json"
+                zipf.writestr(arcname, _dump_json(data))
+                export_files[data_type] = arcname
         
         return export_files
     
-    async def _export_as_csv(self, user_data: Dict[str, Any], 
-                            export_dir: Path) -> Dict[str, str]:
-        """Export user data as CSV files."""
+    def _export_as_csv(self, user_data: Dict[str, Any], 
+                       zipf: zipfile.ZipFile) -> Dict[str, str]:
+        """Export user data as CSV entries in the archive."""
         export_files = {}
         
         for data_type, data in user_data.items():
             if not data:
                 continue
             
-            file_path = export_dir / f"{data_type}.csv"
+            arcname = f"{data_type}.csv"
             
             try:
                 if data_type == "user_profile":
                     # Flatten user profile for CSV
-                    flattened_data = self._flatten_user_profile(data)
-                    df = pd.DataFrame([flattened_data])
+                    self._write_csv(zipf, arcname, [self._flatten_user_profile(data)])
                 else:
-                    # Convert list of documents to DataFrame
-                    flattened_records = []
-                    for record in data:
-                        flattened_records.append(self._flatten_dict(record))
-                    df = pd.DataFrame(flattened_records)
+                    self._write_records_csv(zipf, arcname, data)
                 
-                df.to_csv(file_path, index=False, encoding='utf-8')
-                export_files[data_type] = str(file_path)
+                export_files[data_type] = arcname
                 
             except Exception as e:
                 logger.warning(f"Failed to export {data_type} as CSV: {str(e)}")
                 # Fall back to JSON for complex data
-                json_file_path = export_dir / f"{data_type}.json"
-                json_data = self._serialize_for_json(data)
-                with open(json_file_path, 'w', encoding='utf-8') as f:
-                    json.dump(json_data, f, indent=2, ensure_ascii=False, default=str)
-                export_files[data_type] = str(json_file_path)
+                json_arcname = f"{data_type}.json"
+                zipf.writestr(json_arcname, _dump_json(data))
+                export_files[data_type] = json_arcname
         
         return export_files
     
-    async def _copy_user_files(self, user_id: ObjectId, 
-                              export_dir: Path) -> Dict[str, str]:
-        """Copy user's resume files to export directory."""
-        files_copied = {}
-        
-        # Get all resumes with file info
+    async def _get_resume_files(self, user_id: ObjectId) -> List[Tuple[str, Path, str]]:
+        """List (key, source path, archive name) for the user's resume files."""
         resumes = await self.resume_repo.find_all({"user_id": user_id})
         
-        files_dir = export_dir / "files"
-        files_dir.mkdir(exist_ok=True)
-        
-        for resume in resumes:
-            if resume.file_info and resume.file_info.file_path:
-                source_path = Path(resume.file_info.file_path)
-                if source_path.exists():
-                    # Create unique filename to avoid conflicts
-                    dest_filename = f"resume_{resume.id}_{resume.file_info.filename}"
-                    dest_path = files_dir / dest_filename
-                    
-                    try:
-                        shutil.copy2(source_path, dest_path)
-                        files_copied[f"resume_{resume.id}"] = str(dest_path)
-                    except Exception as e:
-                        logger.warning(f"Failed to copy file {source_path}: {str(e)}")
+        return [
+            (
+                f"resume_{resume.id}",
+                Path(resume.file_info.file_path),
+                # Create unique filename to avoid conflicts
+                f"files/resume_{resume.id}_{resume.file_info.filename}"
+            )
+            for resume in resumes
+            if resume.file_info and resume.file_info.file_path
+        ]
+    
+    def _add_user_files(self, zipf: zipfile.ZipFile,
+                        resume_files: List[Tuple[str, Path, str]]) -> Dict[str, str]:
+        """Stream user's resume files into the archive."""
+        files_added = {}
         
-        return files_copied
+        for key, source_path, arcname in resume_files:
+            if not source_path.exists():
+                continue
+            
+            try:
+                info = zipfile.ZipInfo.from_file(source_path, arcname)
+                if source_path.suffix.lower() in _STORED_SUFFIXES:
+                    info.compress_type = zipfile.ZIP_STORED
+                else:
+                    info.compress_type = zipfile.ZIP_DEFLATED
+                with open(source_path, 'rb') as src, zipf.open(info, 'w') as dest:
+                    shutil.copyfileobj(src, dest, 1 << 20)
+                files_added[key] = arcname
+            except Exception as e:
+                logger.warning(f"Failed to add file {source_path}: {str(e)}")
+        
+        return files_added
     
-    async def _create_zip_archive(self, export_dir: Path) -> Path:
-        """Create ZIP archive of exported data."""
-        zip_path = export_dir.parent / f"{export_dir.name}.zip"
+    def _write_records_csv(self, zipf: zipfile.ZipFile, arcname: str,
+                           records: List[Dict[str, Any]]) -> None:
+        """Stream a list of documents into the archive as CSV.
         
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for file_path in export_dir.rglob('*'):
-                if file_path.is_file():
-                    arcname = file_path.relative_to(export_dir)
-                    zipf.write(file_path, arcname)
+        Records are flattened twice, once to collect the column union and
+        once while writing, so only one flattened row is held at a time.
+        """
+        columns = {}
+        for record in records:
+            columns.update(dict.fromkeys(self._flatten_dict(record)))
         
-        return zip_path
+        self._write_csv(zipf, arcname, map(self._flatten_dict, records), list(columns))
     
-    def _serialize_for_json(self, data: Any) -> Any:
-        """Recursively serialize data for JSON export."""
-        if isinstance(data, dict):
-            return {key: self._serialize_for_json(value) for key, value in data.items()}
-        elif isinstance(data, list):
-            return [self._serialize_for_json(item) for item in data]
-        elif isinstance(data, ObjectId):
-            return str(data)
-        elif isinstance(data, datetime):
-            return data.isoformat()
-        else:
-            return data
+    def _write_csv(self, zipf: zipfile.ZipFile, arcname: str,
+                   rows: Iterable[Dict[str, Any]],
+                   fieldnames: Optional[List[str]] = None) -> None:
+        """Write flat rows as a CSV entry; columns default to the first row's keys."""
+        rows = iter(rows)
+        first_row = next(rows, None)
+        if fieldnames is None:
+            fieldnames = list(first_row or ())
+        
+        with zipf.open(arcname, 'w') as entry, \
+                io.TextIOWrapper(entry, encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames, restval='')
+            writer.writeheader()
+            if first_row is not None:
+                writer.writerow(first_row)
+            writer.writerows(rows)
     
     def _flatten_dict(self, data: Dict[str, Any], parent_key: str = '', 
                      sep: str = '_') -> Dict[str, Any]: